@@ -0,0 +1,26 @@
+import os
+import argparse
+
+# Use SDL's dummy drivers so no display or audio device is needed.
+# These have to be set before pygame is initialized
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame  # noqa: E402
+from src.simulation import Simulation  # noqa: E402
+pygame.init()
+
+CONSTANTS_FILE: str = "data/constants.json"
+
+parser = argparse.ArgumentParser(
+    description="Runs the game headless as fast as possible "
+                "and reports the simulation speed"
+)
+parser.add_argument("--ticks", type=int,
+                    help="number of ticks to simulate")
+parser.add_argument("--tick-rate", type=int,
+                    help="simulated ticks per second of game time")
+args = parser.parse_args()
+
+sim: Simulation = Simulation(CONSTANTS_FILE, args.ticks, args.tick_rate)
+sim.run()
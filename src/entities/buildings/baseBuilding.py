@@ -7,7 +7,9 @@ from src.tileset import Tileset
 from src.window import Window
 from src.entities.player import Player
 from src.utility.image import Image
-from src.particle import Particle
+from src.utility.sound import Sound
+from src.utility.advDict import AdvDict
+from src.particleEmitter import ParticleEmitter
 from src.ui.interfaces.errorUI import ErrorUI
 
 
@@ -120,11 +122,9 @@ class BaseBuilding(Entity):
 
         # Get sound data
         if "sound" in self.getData():
-            self.sound: pygame.mixer.Sound = pygame.mixer.Sound(
-                self.getData()["sound"]
-            )
+            self.sound: Sound = Sound(self.getData()["sound"])
         else:
-            self.sound: pygame.mixer.Sound = None
+            self.sound: Sound = None
 
     def onRemove(self) -> None:
         """ Overriden in subclasses.
@@ -152,6 +152,9 @@ class BaseBuilding(Entity):
                tileset: Tileset, player: Player, sfxVol: float) -> None:
         """ Updates the building by following the cursor and testing placement
             and updating animation if not placing"""
+        # Selected again by the upgrade UI later in the tick
+        self.deselect()
+
         if self.placing:
             self.followCursor(window, camOffset, tileset, player)
             self.testPlace(window, tileset, player)
@@ -188,13 +191,17 @@ class BaseBuilding(Entity):
         mousePos -= super().getSize() / 2
 
         # Calculate tile position of the cursor
-        self.tilePos = mousePos / Tileset.TILE_SIZE
-        self.tilePos = self.tilePos.floor()
+        tilePos: Vect = mousePos / Tileset.TILE_SIZE
+        tilePos = tilePos.floor()
 
         # Clamp to the tile map so it doesn't go over the edge
-        self.tilePos.clamp(Vect(0, 0), tileset.getTileSize() - Vect(1, 1))
+        tilePos.clamp(Vect(0, 0), tileset.getTileSize() - Vect(1, 1))
 
-        # Set position to new self.tilePos
+        self.setTilePos(tilePos)
+
+    def setTilePos(self, tilePos: Vect) -> None:
+        """ Moves the building to the given tile position """
+        self.tilePos = tilePos
         super().setPos(self.tilePos * Tileset.TILE_SIZE)
 
     def testPlace(self, window: Window, tileset: Tileset,
@@ -204,16 +211,20 @@ class BaseBuilding(Entity):
             and not super().collide(player)
 
         if self.placable and window.getMouseJustPressed("left"):
-            # Placed down the building!
-            self.placing = False
+            self.place(tileset)
+
+    def place(self, tileset: Tileset) -> None:
+        """ Places the building down at its tile position """
+        self.placing = False
 
-            # Sets the range of tiles that the building takes up to occupied
-            # so no other building can be placed there
-            tileset.setRangeOccupied(self.tilePos, self.buildingTileSize)
+        # Sets the range of tiles that the building takes up to occupied
+        # so no other building can be placed there
+        tileset.setRangeOccupied(self.tilePos, self.buildingTileSize)
 
+        if self.sound is not None:
             self.sound.play(-1)
-            self.setSpawnParticles()
-            self.onPlace()
+        self.setSpawnParticles()
+        self.onPlace()
 
     def updateSound(self, player: Player, sfxVol: float) -> None:
         """ Plays the sound if the player is close enough """
@@ -222,33 +233,34 @@ class BaseBuilding(Entity):
 
         volume: float = player.getSoundVolume(super().getCenterPos())
         volume *= sfxVol
-        self.sound.set_volume(volume)
+        self.sound.setVolume(volume)
 
     def stopSound(self) -> None:
         """ Stops the sound """
         if self.sound is not None:
             self.sound.stop()
 
+    def releaseSound(self) -> None:
+        """ Releases the sound of a building that won't be used again """
+        if self.sound is not None:
+            self.sound.release()
+
     def render(self, surface: Window | Image, offset: Vect = Vect()) -> None:
-        """ Render with tints if placing """
+        """ Render with tints if placing or selected """
         if not self.placing and not self.selected:
             super().render(surface, offset)
             return
 
-        # Get current animation frame
-        img = super().getAnim().getFrame().copy()
-
-        if self.placing:  # Set semitransparent
-            img.setAlpha(150)
-
-            # Tint red if not placeable
-            if not self.placable:
-                img.tint(*self.redTint)
+        if self.placing:
+            # Set semitransparent, and tint red if not placeable
+            tint = None if self.placable else self.redTint
+            img = super().getAnim().getTintedFrame(tint, alpha=150)
 
         elif self.selected:
             # Tint for selected
-            img.tint(*self.whiteTint, blendMode=pygame.BLEND_ADD)
-            self.selected = False  # Reset selected
+            img = super().getAnim().getTintedFrame(
+                self.whiteTint, blendMode=pygame.BLEND_ADD
+            )
 
         # Draw the new tinted surface to the screen
         surface.render(img, super().getPos() + offset)
@@ -261,16 +273,13 @@ class BaseBuilding(Entity):
         tileset.setRangeOccupied(self.tilePos, self.buildingTileSize, False)
         self.onRemove()
 
-        if self.sound is not None:
-            self.sound.stop()
+        self.releaseSound()
 
-    def getParticles(self) -> list[Particle]:
-        """ Gets a list of particles used for various situations """
-        return Particle.generate(self.PARTICLE_AMOUNT,
-                                 super().getAnim().getFrame(),
-                                 super().getPos(),
-                                 self.PARTICLE_SIZE, self.PARTICLE_SPEED,
-                                 self.PARTICLE_DURATION)
+    def emitParticles(self, particles: ParticleEmitter) -> None:
+        """ Emits particles used for various situations """
+        particles.emit(self.PARTICLE_AMOUNT, super().getAnim(),
+                       super().getPos(), self.PARTICLE_SIZE,
+                       self.PARTICLE_SPEED, self.PARTICLE_DURATION)
 
     # Getters
     def getData(self) -> dict:
@@ -284,6 +293,10 @@ class BaseBuilding(Entity):
         """ Returns the level data for the next level """
         return self.getData()["levels"][self.level]
 
+    def getUpgradeCost(self) -> AdvDict:
+        """ Returns the resources needed to upgrade to the next level """
+        return AdvDict(self.getNextLevelData()["upgrade"]["cost"])
+
     def reachedMaxLevel(self) -> bool:
         """ Returns True if the building has reached the max level """
         return self.level >= len(self.getData()["levels"])
@@ -297,6 +310,11 @@ class BaseBuilding(Entity):
         return False
 
     def isPlacing(self) -> bool: return self.placing
+
+    def isIdle(self) -> bool:
+        """ Returns True if the building is drawn without any tint """
+        return not self.placing and not self.selected
+
     def getLevel(self) -> int: return self.level
     def isSold(self) -> bool: return self.sold
 
@@ -306,4 +324,5 @@ class BaseBuilding(Entity):
 
     # Setters
     def select(self) -> None: self.selected = True
+    def deselect(self) -> None: self.selected = False
     def setSpawnParticles(self) -> None: self.spawnParticles = True
@@ -59,13 +59,12 @@ class Spawner(BaseBuilding):
         # If the timer has been activated
         # (or more than once in the past frame, if lag)
         while self.timer.completed():
-            for _ in range(self.spawnAmount):
-                # Queue the warrior type to be spawned
-                DungeonScene.queuedAllies.append(
-                    Warrior(self.spawnType,
-                            super().getLevel() - self.warriorIndex,
-                            True)
-                )
+            # Queue the warrior type to be spawned
+            DungeonScene.queuedAllies.extend(
+                Warrior.spawnMany(self.spawnType,
+                                  super().getLevel() - self.warriorIndex,
+                                  True, self.spawnAmount)
+            )
 
     # Getters
     def getSpawnType(self) -> str:
@@ -13,11 +13,20 @@ class Entity:
         Handles the animation and position """
     log = logging.getLogger(__name__)
 
+    # How far between the previous and current position to render
+    # entities, used with a fixed timestep to smooth movement
+    renderAlpha: float = 1
+
+    @classmethod
+    def setRenderAlpha(cls, alpha: float) -> None:
+        cls.renderAlpha = alpha
+
     def __init__(self, animData: dict = None, pos: Vect = Vect()) -> None:
         """ Setup base values.
             animData must contain "path", "frames", and "delay" keys.
             pos is an optional argument which is set to (0, 0) by default """
         self.pos: Vect = pos
+        self.prevPos: Vect = None  # Position before the last update
 
         if animData is not None:
             self.animation = self.loadAnim(animData)
@@ -32,12 +41,16 @@ class Entity:
                          animData["delay"])
 
     def update(self, window: Window) -> None:
-        """ Updates the animation """
+        """ Updates the animation and stores the position
+            from before the entity moves this update """
         self.animation.update(window)
 
+        if window.isFixedTimestep():
+            self.prevPos = self.pos.copy()
+
     def render(self, surface: Window | Image, offset: Vect = Vect()) -> None:
         """ Renders the animation at the entity's current position"""
-        self.animation.render(surface, self.pos + offset)
+        self.animation.render(surface, self.getRenderPos() + offset)
 
     def collision(self, window: Window,
                   entities: list[Entity], velocity: Vect) -> list[Entity]:
@@ -45,6 +58,8 @@ class Entity:
             and also updating position based on velocity.
             Returns a list of collided entities """
 
+        self.requireMutablePos()
+
         # Apply velocity in each direction separately
         # and then check for collisions,
         # then adjust pos accordingly to edge of any collisions
@@ -60,6 +75,8 @@ class Entity:
                       entities: list[Entity]) -> list[Entity]:
         """ Check and adjust pos for any collisions in a single direction.
             dir parameter must be "x" or "y". Returns a list of collided """
+        self.requireMutablePos()
+
         collided: list[Entity] = []
 
         # Check collision with each entity
@@ -92,6 +109,8 @@ class Entity:
     def lockToRect(self, topLeft: Vect, bottomRight: Vect,
                    velocity: Vect = None) -> None:
         """ Locks the entity to a rect (used for map boundaries) """
+        self.requireMutablePos()
+
         # Clamp position to inside the rect
         bottomRight -= self.getSize()
         self.pos.clamp(topLeft, bottomRight)
@@ -106,11 +125,31 @@ class Entity:
         if self.pos.y == topLeft.y or self.pos.y == bottomRight.y:
             velocity.y = 0
 
+    def requireMutablePos(self) -> None:
+        """ Raises an error if the position can't be changed in place,
+            since changing the copy it gives would silently do nothing """
+        if not self.isPosMutable():
+            raise RuntimeError(f"Unable to change the position of "
+                               f"{type(self).__name__} in place")
+
+    def isPosMutable(self) -> bool:
+        """ Returns whether pos can be changed in place. Entities that
+            store their position elsewhere give a copy, which can only be
+            changed by assigning to pos (which addPos and setPos do) """
+        return True
+
     # Getters
     def getAnim(self) -> Animation: return self.animation
     def getSize(self) -> Vect: return self.animation.getSize()
     def getPos(self) -> Vect: return self.pos
 
+    def getRenderPos(self) -> Vect:
+        """ Returns the position between the previous and current
+            position to render the entity at """
+        if self.prevPos is None or self.renderAlpha == 1:
+            return self.pos
+        return self.prevPos + (self.pos - self.prevPos) * self.renderAlpha
+
     def getRect(self) -> pygame.Rect:
         return Vect.toRect(self.pos, self.animation.getSize())
 
@@ -1,28 +1,23 @@
 import logging
+import math
 from src.entities.entity import Entity
 from src.utility.vector import Vect
+from src.utility.image import Image
+from src.utility.spatialHash import SpatialHash
 from src.window import Window
-from src.tileset import Tileset
-from src.ui.interfaces.errorUI import ErrorUI
 
 
 class Projectile(Entity):
+    """ A single projectile, used by ProjectileList
+        when NumPy isn't installed for the ProjectilePool """
     log = logging.getLogger(__name__)
 
-    @classmethod
-    def loadStatic(cls, constants: dict) -> None:
-        """ Loads the projectile animation data from consts """
-        try:
-            cls.ANIMS: dict = constants["projectiles"]
-        except KeyError:
-            ErrorUI.create("Unable to find projectiles in constants",
-                           cls.log)
-
-    def __init__(self, type: str, angle: float, speed: float,
-                 damage: float, knockback: float,
-                 startingPos: Vect, isAlly: bool) -> None:
-        """ Sets up the projectile anim and pos """
-        super().__init__(self.ANIMS[type], startingPos)
+    def __init__(self, animData: dict, angle: float, speed: float,
+                 damage: float, knockback: float, startingPos: Vect,
+                 isAlly: bool, maxRange: float = -1) -> None:
+        """ Sets up the projectile anim and pos.
+            maxRange is the distance it can travel, -1 for no limit """
+        super().__init__(animData, startingPos)
 
         self.angle: float = angle
         self.speed: float = speed
@@ -30,29 +25,39 @@ class Projectile(Entity):
         self.knockback: float = knockback
         self.isAlly: bool = isAlly
 
+        # Time alive and max time alive
+        self.age: float = 0
+        self.lifetime: float = math.inf
+        if maxRange >= 0 and speed > 0:
+            self.lifetime = maxRange / speed
+
         self.remove: bool = False
 
         # Center the projectile onto the starting pos
         # by subtracting half its size from the pos
         super().addPos(-super().getSize() // 2)
+        self.prevPos = self.pos.copy()
 
-    def update(self, window: Window, tileset: Tileset) -> None:
-        """ Updates the particle anim and movement """
-        super().update(window)
+    def update(self, deltaTime: float, mapSize: Vect) -> None:
+        """ Updates the projectile movement and lifetime """
+        self.prevPos = self.pos.copy()
 
-        self.move(window)
+        self.move(deltaTime)
+        self.age += deltaTime
 
-        self.testOutOfBounds(tileset.getSize())
+        self.testOutOfBounds(mapSize)
+        if self.age >= self.lifetime:
+            self.remove = True
 
-    def move(self, window: Window) -> None:
+    def move(self, deltaTime: float) -> None:
         """ Updates the projectile position """
         # Movement based on the angle and speed
         moveAmount: Vect = Vect.angleMove(self.angle) * \
-            self.speed * window.getDeltaTime()
+            self.speed * deltaTime
         super().addPos(moveAmount)
 
-    def testOutOfBounds(self, tilesetSize: Vect) -> bool:
-        """ Tests and returns True if the projectile is out of the tileset """
+    def testOutOfBounds(self, tilesetSize: Vect) -> None:
+        """ Removes the projectile if it's out of the tileset """
         if self.remove:
             return
 
@@ -64,14 +69,23 @@ class Projectile(Entity):
                        pos.x + size.x >= tilesetSize.x or
                        pos.y + size.y >= tilesetSize.y)
 
-    def collisions(self, warriors: list) -> None:
-        """ Tests if the projectile collides with the entity """
-        for warrior in warriors:
-            if super().collide(warrior):
+    def collisions(self, warriors: SpatialHash) -> None:
+        """ Tests if the projectile collides with any warrior in the grid,
+            only testing the warriors in cells near the projectile """
+        rect = super().getRect()
+
+        for warrior in warriors.queryRect(rect):
+            if rect.colliderect(warrior.getRect()):
                 self.remove = True
                 warrior.hit(self.damage, self.angle, self.knockback)
                 return
 
+    def render(self, surface: Window | Image, offset: Vect = Vect()) -> None:
+        """ Renders the frame for how long the projectile has been alive """
+        anim = super().getAnim()
+        anim.renderFrame(surface, super().getRenderPos() + offset,
+                         anim.getFrameAt(self.age))
+
     # Getters
     def shouldRemove(self) -> bool: return self.remove
     def hitsEnemies(self) -> bool: return self.isAlly
@@ -0,0 +1,65 @@
+import logging
+import pygame
+
+from src.entities.projectile import Projectile
+from src.entities.projectilePool import ProjectilePool
+from src.utility.vector import Vect
+from src.utility.image import Image
+from src.utility.spatialHash import SpatialHash
+from src.window import Window
+
+
+class ProjectileList:
+    """ Stores every projectile as its own Projectile object.
+        Has the same methods as ProjectilePool, and is used
+        instead of it when NumPy isn't installed """
+    log = logging.getLogger(__name__)
+
+    def __init__(self) -> None:
+        self.projectiles: list[Projectile] = []
+
+    def spawn(self, type: str, angle: float, speed: float,
+              damage: float, knockback: float, startingPos: Vect,
+              isAlly: bool, maxRange: float = -1) -> None:
+        """ Adds a projectile centered on the starting pos.
+            maxRange is the distance it can travel, -1 for no limit """
+        self.projectiles.append(
+            Projectile(ProjectilePool.ANIMS[type], angle, speed, damage,
+                       knockback, startingPos, isAlly, maxRange)
+        )
+
+    def update(self, deltaTime: float, mapSize: Vect) -> None:
+        """ Moves every projectile, marking those that
+            hit an edge of the map or passed their lifetime """
+        for projectile in self.projectiles:
+            projectile.update(deltaTime, mapSize)
+
+    def collisions(self, allies: SpatialHash, enemies: SpatialHash) -> None:
+        """ Tests projectiles against the warriors of the opposing side """
+        for projectile in self.projectiles:
+            if projectile.shouldRemove():
+                continue
+
+            # Allies' projectiles hit enemies and vice versa
+            if projectile.hitsEnemies():
+                projectile.collisions(enemies)
+            else:
+                projectile.collisions(allies)
+
+    def removeFinished(self) -> None:
+        """ Removes projectiles that are out of bounds or hit something """
+        self.projectiles[:] = [  # list comprehension in place
+            projectile for projectile in self.projectiles
+            if not projectile.shouldRemove()
+        ]
+
+    def render(self, surface: Window | Image, offset: Vect = Vect(),
+               view: pygame.Rect = None) -> None:
+        """ Renders every projectile. If given,
+            only projectiles overlapping the view are rendered """
+        for projectile in self.projectiles:
+            if view is None or view.colliderect(projectile.getRect()):
+                projectile.render(surface, offset)
+
+    # Getters
+    def getCount(self) -> int: return len(self.projectiles)
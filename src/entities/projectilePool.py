@@ -0,0 +1,240 @@
+import logging
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # Projectile objects are used instead
+    np = None
+
+from src.entities.entity import Entity
+from src.utility.animation import Animation
+from src.utility.vector import Vect
+from src.utility.image import Image
+from src.utility.spatialHash import SpatialHash
+from src.window import Window
+from src.ui.interfaces.errorUI import ErrorUI
+
+
+class ProjectilePool:
+    """ Stores every projectile in NumPy arrays, so they are moved,
+        tested against the map bounds, and removed all at once.
+        Projectiles of the same type share a single animation.
+        Requires NumPy, otherwise a ProjectileList is used instead """
+    log = logging.getLogger(__name__)
+
+    @staticmethod
+    def isAvailable() -> bool:
+        """ Returns whether NumPy could be imported """
+        return np is not None
+
+    @classmethod
+    def loadStatic(cls, constants: dict) -> None:
+        """ Loads the projectile animation data from consts """
+        try:
+            cls.ANIMS: dict = constants["projectiles"]
+        except KeyError:
+            ErrorUI.create("Unable to find projectiles in constants",
+                           cls.log)
+
+    def __init__(self, capacity: int = 256) -> None:
+        """ Creates empty projectile arrays with the given capacity """
+        self.count: int = 0
+
+        # Projectile types, where the index is the type ID
+        self.types: list[str] = []
+        self.anims: list[Animation] = []  # Shared animation for each type
+        self.sizes: np.ndarray = np.zeros((0, 2))  # Size of each type
+
+        self.pos = np.zeros((capacity, 2))  # Top left positions
+        self.prevPos = np.zeros((capacity, 2))  # Positions last update
+        self.typeId = np.zeros(capacity, dtype=np.int64)
+        self.angle = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.damage = np.zeros(capacity)
+        self.knockback = np.zeros(capacity)
+        self.isAlly = np.zeros(capacity, dtype=bool)
+
+        # Time alive and max time alive (inf for no limit)
+        self.age = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity)
+
+        # Projectiles to remove at the end of the frame
+        self.remove = np.zeros(capacity, dtype=bool)
+
+        # Reused for collision tests
+        self.rect: pygame.Rect = pygame.Rect(0, 0, 0, 0)
+
+    def getArrayNames(self) -> tuple[str]:
+        """ Returns the names of every per-projectile array """
+        return ("pos", "prevPos", "typeId", "angle", "speed", "damage",
+                "knockback", "isAlly", "age", "lifetime", "remove")
+
+    def grow(self) -> None:
+        """ Doubles the capacity of every array """
+        for name in self.getArrayNames():
+            array = getattr(self, name)
+            newArray = np.zeros((len(array) * 2,) + array.shape[1:],
+                                dtype=array.dtype)
+            newArray[:len(array)] = array
+            setattr(self, name, newArray)
+
+    def getTypeId(self, type: str) -> int:
+        """ Returns the ID of a projectile type,
+            loading its animation if it's the first of the type """
+        if type in self.types:
+            return self.types.index(type)
+
+        anim: Animation = Entity.loadAnim(self.ANIMS[type])
+
+        self.types.append(type)
+        self.anims.append(anim)
+        self.sizes = np.vstack([self.sizes, anim.getSize().toTuple()])
+
+        return len(self.types) - 1
+
+    def spawn(self, type: str, angle: float, speed: float,
+              damage: float, knockback: float, startingPos: Vect,
+              isAlly: bool, maxRange: float = -1) -> None:
+        """ Adds a projectile centered on the starting pos.
+            maxRange is the distance it can travel, -1 for no limit """
+        if self.count == len(self.age):
+            self.grow()
+
+        row: int = self.count
+        typeId: int = self.getTypeId(type)
+
+        # Center the projectile onto the starting pos
+        # by subtracting half its size from the pos
+        size: Vect = self.anims[typeId].getSize()
+        pos: Vect = startingPos + (-size // 2)
+
+        self.pos[row] = pos.toTuple()
+        self.prevPos[row] = self.pos[row]
+        self.typeId[row] = typeId
+        self.angle[row] = angle
+        self.speed[row] = speed
+        self.damage[row] = damage
+        self.knockback[row] = knockback
+        self.isAlly[row] = isAlly
+        self.age[row] = 0
+        self.remove[row] = False
+
+        # Time until the projectile has traveled its max range
+        if maxRange >= 0 and speed > 0:
+            self.lifetime[row] = maxRange / speed
+        else:
+            self.lifetime[row] = np.inf
+
+        self.count += 1
+
+    def update(self, deltaTime: float, mapSize: Vect) -> None:
+        """ Moves every projectile, marking those that
+            hit an edge of the map or passed their lifetime """
+        n: int = self.count
+        if n == 0:
+            return
+
+        pos = self.pos[:n]
+        angle = self.angle[:n]
+        speed = self.speed[:n]
+
+        self.prevPos[:n] = pos
+
+        # Movement based on the angle and speed
+        pos[:, 0] += np.cos(angle) * speed * deltaTime
+        pos[:, 1] += np.sin(angle) * speed * deltaTime
+
+        self.age[:n] += deltaTime
+
+        # Testing if the projectile hit an edge of the tileset
+        bottomRight = pos + self.sizes[self.typeId[:n]]
+        outOfBounds = ((pos[:, 0] <= 0) | (pos[:, 1] <= 0) |
+                       (bottomRight[:, 0] >= mapSize.x) |
+                       (bottomRight[:, 1] >= mapSize.y))
+
+        self.remove[:n] |= outOfBounds | (self.age[:n] >= self.lifetime[:n])
+
+    def collisions(self, allies: SpatialHash, enemies: SpatialHash) -> None:
+        """ Tests projectiles against the warriors of the opposing side,
+            only checking warriors in cells near each projectile.
+            A projectile hits the first warrior it collides with """
+        n: int = self.count
+
+        # Python lists are faster to index one at a time than arrays
+        remove: list[bool] = self.remove[:n].tolist()
+        rects: list[list[float]] = np.hstack(
+            (self.pos[:n], self.sizes[self.typeId[:n]])
+        ).tolist()
+        isAlly: list[bool] = self.isAlly[:n].tolist()
+
+        rect: pygame.Rect = self.rect
+
+        for row in range(n):
+            if remove[row]:
+                continue
+
+            # Allies' projectiles hit enemies and vice versa
+            warriors: SpatialHash = enemies if isAlly[row] else allies
+            rect.update(rects[row])
+
+            for warrior in warriors.queryRect(rect):
+                if rect.colliderect(warrior.getRect()):
+                    self.remove[row] = True
+                    warrior.hit(float(self.damage[row]),
+                                float(self.angle[row]),
+                                float(self.knockback[row]))
+                    break
+
+    def removeFinished(self) -> None:
+        """ Removes marked projectiles, packing the rest together """
+        n: int = self.count
+        keep = ~self.remove[:n]
+        newCount: int = int(keep.sum())
+
+        if newCount == n:
+            return
+
+        for name in self.getArrayNames():
+            array = getattr(self, name)
+            array[:newCount] = array[:n][keep]
+
+        self.count = newCount
+
+    def render(self, surface: Window | Image, offset: Vect = Vect(),
+               view: pygame.Rect = None) -> None:
+        """ Renders every projectile, with its animation frame
+            found from how long it has been alive.
+            If given, only projectiles overlapping the view are rendered """
+        n: int = self.count
+
+        # Interpolated between the positions before and after the update
+        alpha: float = Entity.renderAlpha
+        pos = self.prevPos[:n] + (self.pos[:n] - self.prevPos[:n]) * alpha
+        typeId = self.typeId[:n]
+        age = self.age[:n]
+
+        if view is not None:
+            bottomRight = pos + self.sizes[typeId]
+            onScreen = ((pos[:, 0] < view.right) &
+                        (pos[:, 1] < view.bottom) &
+                        (bottomRight[:, 0] > view.left) &
+                        (bottomRight[:, 1] > view.top))
+
+            pos, typeId, age = pos[onScreen], typeId[onScreen], age[onScreen]
+
+        # Submitted to the surface all at once
+        blits: list[tuple] = []
+        offsetX, offsetY = offset.x, offset.y
+
+        for (x, y), typeId, age in zip(pos.tolist(),
+                                       typeId.tolist(),
+                                       age.tolist()):
+            anim: Animation = self.anims[typeId]
+            blits.append((anim.getSpritesheet().getSurf(),
+                          (x + offsetX, y + offsetY),
+                          anim.getFrameRect(anim.getFrameAt(age))))
+
+        surface.renderMany(blits)
+
+    # Getters
+    def getCount(self) -> int: return self.count
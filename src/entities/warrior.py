@@ -1,17 +1,20 @@
 from __future__ import annotations
 
 import logging
-import pygame
 import random
 from src.entities.entity import Entity
-from src.entities.projectile import Projectile
+from src.entities.projectilePool import ProjectilePool
+from src.entities.warriorEngine import (WarriorEngine, GroupField,
+                                        PosField, TargetField)
 from src.window import Window
 import src.utility.utility as util
 from src.tileset import Tileset
 from src.utility.vector import Vect
 from src.utility.image import Image
 from src.utility.timer import Timer
-from src.particle import Particle
+from src.utility.sound import Sound
+from src.utility.spatialHash import SpatialHash
+from src.particleEmitter import ParticleEmitter
 from src.ui.interfaces.errorUI import ErrorUI
 from src.entities.player import Player
 
@@ -21,6 +24,30 @@ class Warrior(Entity):
         including movement and pathfinding """
     log = logging.getLogger(__name__)
 
+    # Simulation state, which is stored in the arrays of the warrior's
+    # engine group when the array engine is being used
+    pos = PosField()
+    prevPos = PosField()
+    health = GroupField()
+    speed = GroupField()
+    angle = GroupField()
+    knockbackVel = GroupField()
+    knockbackAngle = GroupField()
+    target = TargetField()
+
+    # The WarriorGroup and row the warrior is in, if any
+    engineGroup = None
+    engineIndex: int = -1
+
+    # Dead warriors that can be spawned again, so their animation,
+    # sounds, and timers don't have to be created again.
+    # Key: (type, level, isAlly), value: list of pooled warriors
+    pool: dict[tuple[str, int, bool], list[Warrior]] = {}
+
+    # Number of warriors spawned so far, used to
+    # render warriors in the order they were spawned
+    spawnCount: int = 0
+
     @classmethod
     def loadStatic(cls, constants: dict) -> None:
         """ Loads the warrior data JSON file """
@@ -32,6 +59,14 @@ class Warrior(Entity):
             ErrorUI.create("Unable to find warriors -> jsonPath in constants",
                            cls.log)
 
+        # Largest aoe attack range, which is how far from the screen
+        # a warrior can be and still have its aoe circle reach onto it
+        cls.MAX_AOE_RANGE: float = max(
+            (level["range"] for data in cls.WARRIOR_DICT.values()
+             if data["attackType"] == "aoe" for level in data["levels"]),
+            default=0
+        ) * Image.SCALE
+
         try:
             cls.KNOCKBACK_ANGLE_RANGE: float = \
                 constants["warriors"]["knockbackAngleRange"]
@@ -41,6 +76,41 @@ class Warrior(Entity):
                            recoverable=True)
             cls.KNOCKBACK_ANGLE_RANGE: float = 1
 
+        try:
+            # Size of the spatial hash cells used to find nearby warriors
+            cls.GRID_CELL_SIZE: float = \
+                constants["warriors"]["gridCellSize"] * Image.SCALE
+        except KeyError:
+            ErrorUI.create("Unable to find warriors -> gridCellSize "
+                           "in constants, defaulting to 60", cls.log,
+                           recoverable=True)
+            cls.GRID_CELL_SIZE: float = 60 * Image.SCALE
+
+        try:
+            # Whether to simulate warriors with the array engine
+            cls.ARRAY_ENGINE: bool = constants["warriors"]["arrayEngine"]
+        except KeyError:
+            ErrorUI.create("Unable to find warriors -> arrayEngine "
+                           "in constants, defaulting to false", cls.log,
+                           recoverable=True)
+            cls.ARRAY_ENGINE: bool = False
+
+        if cls.ARRAY_ENGINE and not WarriorEngine.isAvailable():
+            ErrorUI.create("warriors -> arrayEngine is enabled but NumPy "
+                           "is not installed, disabling it", cls.log,
+                           recoverable=True)
+            cls.ARRAY_ENGINE: bool = False
+
+        try:
+            # Most pooled warriors of each type, level, and side.
+            # No more enemies than this are alive at once
+            cls.POOL_SIZE: int = constants["waves"]["maxActiveEnemies"]
+        except KeyError:
+            ErrorUI.create("Unable to find waves -> maxActiveEnemies "
+                           "in constants. Defaulting to 300", cls.log,
+                           recoverable=True)
+            cls.POOL_SIZE: int = 300
+
         try:
             cls.AOE_CIRCLE_COLOR: tuple[int] = \
                 constants["warriors"]["aoeCircleColor"]
@@ -92,6 +162,46 @@ class Warrior(Entity):
         cls.ALLY_SPAWNS: list[list[int]] = allySpawns
         cls.ENEMY_SPAWNS: list[list[int]] = enemySpawns
 
+    @classmethod
+    def spawnMany(cls, type: str, level: int, isAlly: bool,
+                  amount: int) -> list[Warrior]:
+        """ Spawns the given amount of warriors, reusing pooled warriors
+            of the same type, level, and side before creating new ones """
+        pooled: list[Warrior] = cls.pool.get((type, level, isAlly), [])
+        warriors: list[Warrior] = []
+
+        while pooled and len(warriors) < amount:
+            warrior: Warrior = pooled.pop()
+            warrior.respawn()
+            warriors.append(warrior)
+
+        for _ in range(amount - len(warriors)):
+            warriors.append(Warrior(type, level, isAlly))
+
+        return warriors
+
+    @classmethod
+    def recycle(cls, warriors: list[Warrior]) -> None:
+        """ Adds dead warriors to the pool to be spawned again,
+            releasing those that don't fit in it """
+        for warrior in warriors:
+            key = (warrior.type, warrior.level, warrior.isAlly)
+            pooled: list[Warrior] = cls.pool.setdefault(key, [])
+
+            if len(pooled) < cls.POOL_SIZE:
+                pooled.append(warrior)
+            else:
+                warrior.releaseSounds()
+
+    @classmethod
+    def clearPool(cls) -> None:
+        """ Releases and removes every pooled warrior """
+        for pooled in cls.pool.values():
+            for warrior in pooled:
+                warrior.releaseSounds()
+
+        cls.pool.clear()
+
     def __init__(self, type: str, level: int, isAlly: bool) -> None:
         """ Setup randomized position, its animation, stats, etc. """
         spawnPos = self.pickSpawnPos(isAlly)
@@ -128,10 +238,29 @@ class Warrior(Entity):
                                             self.AOE_CIRCLE_COLOR)
 
             self.aoeTimer: Timer = Timer(self.AOE_CIRCLE_TIME)
-            self.showAoeCircle: bool = False
-
             self.aoeAnimPos: Vect = Vect()  # Position of the aoe attack
 
+        # Damage flash indicator
+        self.damageTimer: Timer = Timer(self.DAMAGE_TIME)
+
+        # Sounds start silent until the scene sets their volume,
+        # which only happens if the warrior is within hearing range
+        if self.SPAWN_SOUND is not None:
+            self.spawnSound: Sound = Sound(self.SPAWN_SOUND)
+        if self.HIT_SOUND is not None:
+            self.hitSound: Sound = Sound(self.HIT_SOUND)
+
+        self.resetState()
+
+    def resetState(self) -> None:
+        """ Resets everything that changes during the warrior's life,
+            so a dead warrior from the pool can be spawned again """
+        self.health: int = self.getLevelData()["health"]
+        self.attackTimer.reset()
+
+        self.spawnOrder: int = Warrior.spawnCount
+        Warrior.spawnCount += 1
+
         self.speed = 0
         self.angle = 0
 
@@ -142,16 +271,25 @@ class Warrior(Entity):
         # Enemy to target, move to, and attack
         self.target: Warrior = None
 
-        # Damage flash indicator
-        self.damageTimer: Timer = Timer(self.DAMAGE_TIME)
         self.showDamageTint: bool = False
+        self.damageTimer.reset()
+
+        if self.attackType == "aoe":
+            self.showAoeCircle: bool = False
+            self.aoeTimer.reset()
+
+        super().getAnim().restart()
 
-        # Sounds
+        self.setSoundVolume(0)
         if self.SPAWN_SOUND is not None:
-            self.spawnSound = pygame.mixer.Sound(self.SPAWN_SOUND)
-            self.spawnSound.play(0)
-        if self.HIT_SOUND is not None:
-            self.hitSound = pygame.mixer.Sound(self.HIT_SOUND)
+            self.spawnSound.play()
+
+    def respawn(self) -> None:
+        """ Moves a pooled warrior to a new spawn position
+            and resets it to full health """
+        self.pos = self.pickSpawnPos(self.isAlly)
+        self.prevPos = None  # Don't interpolate from where it died
+        self.resetState()
 
     def pickSpawnPos(self, isAlly: bool) -> Vect:
         """ Picks a random spawn position
@@ -165,7 +303,7 @@ class Warrior(Entity):
     def setStats(self, level: int) -> None:
         """ Sets the warrior's stats based on level """
         self.level = level
-        data = self.WARRIOR_DICT[self.type]["levels"][level - 1]
+        data = self.getLevelData()
 
         self.health: int = data["health"]
         self.damage: int = data["damage"]
@@ -182,11 +320,17 @@ class Warrior(Entity):
         if self.attackType == "projectile":
             self.projectileSpeed: float = data["projectileSpeed"] * Image.SCALE
 
+            # Distance projectiles can travel before disappearing,
+            # -1 means they travel until they leave the map
+            self.projectileRange: float = -1
+            if "projectileRange" in data:
+                self.projectileRange = data["projectileRange"] * Image.SCALE
+
     def update(self, window: Window, tileset: Tileset,
-               opponents: list[Warrior], player: Player,
-               sfxVol: float) -> None:
+               opponents: SpatialHash) -> None:
         """ Updates warrior: moving, attacking, etc."""
         super().update(window)
+        self.updateEffects(window)
 
         # Update target and then move towards it
         self.updateTarget(opponents)
@@ -194,12 +338,12 @@ class Warrior(Entity):
         self.moveToTarget(window)
         self.updateKnockback(window)
 
-        # Update sound volumes
-        self.updateSounds(player, sfxVol)
-
         # Lock to tileset
         super().lockToRect(Vect(0, 0), tileset.getSize())
 
+    def updateEffects(self, window: Window) -> None:
+        """ Updates the damage tint and aoe circle. The array engine
+            only updates warriors showing one (see hasEffects) """
         # Update damage tint timer
         if self.showDamageTint:
             self.damageTimer.update(window)
@@ -220,24 +364,21 @@ class Warrior(Entity):
                 self.showAoeCircle = False
                 self.aoeTimer.reset()
 
-    def updateTarget(self, opponents: list[Warrior]) -> None:
-        """ Finds the closest opponent to target
+    def updateTarget(self, opponents: SpatialHash) -> None:
+        """ Finds the closest living opponent to target
             if the warrior does not already have a target """
         if self.hasTarget() and self.target.isDead():
             self.target = None  # Reset target if it's dead
 
-        if self.hasTarget() or len(opponents) == 0:
+        if self.hasTarget():
             return
 
-        self.target = opponents[0]
-        lowestDist: float = super().getPos().dist(opponents[0].getPos())
+        # Search the grid outwards from this warrior for the closest opponent
+        self.target = opponents.nearest(super().getCenterPos(),
+                                        lambda warrior: not warrior.isDead())
 
-        for warrior in opponents:
-            # Get distance from warrior
-            dist = super().getPos().dist(warrior.getPos())
-            if dist < lowestDist:
-                self.target = warrior
-                lowestDist = dist
+        if not self.hasTarget():
+            return  # No opponents left
 
         # Reset attack timer
         self.attackTimer.reset()
@@ -318,14 +459,15 @@ class Warrior(Entity):
     def updateSounds(self, player: Player, sfxVol: float) -> None:
         """ Sets the sound volume based on the player's distance """
         # Sound relative to the position of the player
-        volume: float = player.getSoundVolume(super().getPos())
-        volume *= sfxVol
+        volume: float = player.getSoundVolume(super().getCenterPos())
+        self.setSoundVolume(volume * sfxVol)
 
-        # Set volumes
+    def setSoundVolume(self, volume: float) -> None:
+        """ Sets the volume of all the warrior's sounds """
         if self.SPAWN_SOUND is not None:
-            self.spawnSound.set_volume(volume)
+            self.spawnSound.setVolume(volume)
         if self.HIT_SOUND is not None:
-            self.hitSound.set_volume(volume)
+            self.hitSound.setVolume(volume)
 
     def stopSounds(self) -> None:
         """ Stops all sounds """
@@ -334,8 +476,15 @@ class Warrior(Entity):
         if self.HIT_SOUND is not None:
             self.hitSound.stop()
 
-    def updateAttack(self, window: Window, opponents: list[Warrior],
-                     projectiles: list[Projectile]) -> None:
+    def releaseSounds(self) -> None:
+        """ Releases the sounds of a warrior that won't be used again """
+        if self.SPAWN_SOUND is not None:
+            self.spawnSound.release()
+        if self.HIT_SOUND is not None:
+            self.hitSound.release()
+
+    def updateAttack(self, window: Window, opponents: SpatialHash,
+                     projectiles: ProjectilePool) -> None:
         """ Updates the warrior's attack, and attacking when timer is up """
         if not self.hasTarget() or self.speed > 0:
             return
@@ -346,8 +495,8 @@ class Warrior(Entity):
         while self.attackTimer.completed():
             self.attack(opponents, projectiles)
 
-    def attack(self, opponents: list[Warrior],
-               projectiles: list[Projectile]) -> None:
+    def attack(self, opponents: SpatialHash,
+               projectiles: ProjectilePool) -> None:
         """ Attacks, based on self.attackType """
         if self.attackType == "projectile":
             self.spawnProjectile(projectiles)
@@ -355,40 +504,44 @@ class Warrior(Entity):
         elif self.attackType == "aoe":
             self.aoeAttack(opponents)
 
-    def spawnProjectile(self, projectiles: list[Projectile]) -> None:
+    def spawnProjectile(self, projectiles: ProjectilePool) -> None:
         """ Spawns a projectile from warrior data """
         # position of warrior plus projectile spawn offset
         spawnPos: Vect = super().getPos() + self.projectileSpawnPos
         # angle from the particle spawn position to the target
         angle = spawnPos.angle(self.target.getCenterPos())
 
-        # Create projectile object from data
-        proj: Projectile = Projectile(self.type, angle,
-                                      self.projectileSpeed, self.damage,
-                                      self.attackKnockback,
-                                      spawnPos, self.isAlly)
-
-        projectiles.append(proj)
+        # Add projectile to the pool from data
+        projectiles.spawn(self.type, angle, self.projectileSpeed,
+                          self.damage, self.attackKnockback,
+                          spawnPos, self.isAlly, self.projectileRange)
 
-    def aoeAttack(self, opponents: list[Warrior]) -> None:
+    def aoeAttack(self, opponents: SpatialHash) -> None:
         """ Deals damage to all opponents in range """
         centerPos = self.getCenterPos()
 
         self.showAoeCircle = True
+        self.trackEffects()
 
         # Center aoe attack animation on the player
         self.aoeAnimPos = centerPos - self.range
 
-        for opponent in opponents:
-            opponentPos: Vect = opponent.getCenterPos()
-            # Distance between the center of this warrior and the opponent
-            dist: float = centerPos.dist(opponentPos)
+        # Only the opponents within range of the center of this warrior
+        for opponent in opponents.queryCircle(centerPos, self.range):
+            # Getting angle from the center of this warrior to the opponent
+            angle = centerPos.angle(opponent.getCenterPos())
 
-            if dist <= self.range:
-                # Getting angle from the center of this warrior to the opponent
-                angle = centerPos.angle(opponentPos)
+            opponent.hit(self.damage, angle, self.attackKnockback)
 
-                opponent.hit(self.damage, angle, self.attackKnockback)
+    def isPosMutable(self) -> bool:
+        """ Warriors in an engine group get a copy of their row's position """
+        return self.engineGroup is None
+
+    def trackEffects(self) -> None:
+        """ Has the warrior's engine group, if it's in one,
+            update the effect the warrior just started showing """
+        if self.engineGroup is not None:
+            self.engineGroup.trackEffects(self)
 
     def renderAoeAttack(self, surface: Window | Image,
                         offset: Vect = Vect()) -> None:
@@ -409,31 +562,45 @@ class Warrior(Entity):
         self.knockbackVel = knockbackVel
 
         self.showDamageTint = True
+        self.trackEffects()
 
-        self.hitSound.play(0)
+        self.hitSound.play()
 
     def render(self, surface: Window | Image, offset: Vect = Vect()) -> None:
         """ Renders the warrior and its aoe attack if necessary """
+        if self.engineGroup is not None:
+            # The engine only advances the animation time
+            self.engineGroup.syncAnim(self)
+
         self.renderAoeAttack(surface, offset)
 
         if self.showDamageTint:
             # Render with damage tint
-            img = super().getAnim().getFrame().copy()
-            img.tint(self.DAMAGE_TINT)
-            surface.render(img, super().getPos() + offset)
+            img = super().getAnim().getTintedFrame(self.DAMAGE_TINT)
+            surface.render(img, super().getRenderPos() + offset)
 
         else:
             super().render(surface, offset)
 
-    def getDeathParticles(self) -> list[Particle]:
-        """ Returns a list of particles for the warrior's death """
-        return Particle.generate(self.PARTICLE_AMOUNT,
-                                 super().getAnim().getFrame(),
-                                 super().getPos(),
-                                 self.PARTICLE_SIZE, self.PARTICLE_SPEED,
-                                 self.PARTICLE_DURATION)
+    def emitDeathParticles(self, particles: ParticleEmitter) -> None:
+        """ Emits particles for the warrior's death """
+        particles.emit(self.PARTICLE_AMOUNT, super().getAnim(),
+                       super().getPos(), self.PARTICLE_SIZE,
+                       self.PARTICLE_SPEED, self.PARTICLE_DURATION)
 
     # Getters
+    def getLevelData(self) -> dict:
+        """ Returns the warriors.json data for the warrior's level """
+        return self.WARRIOR_DICT[self.type]["levels"][self.level - 1]
+
+    def getSpawnOrder(self) -> int: return self.spawnOrder
+
+    def hasEffects(self) -> bool:
+        """ Returns whether the warrior is showing
+            a damage tint or aoe circle """
+        return self.showDamageTint or (self.attackType == "aoe" and
+                                       self.showAoeCircle)
+
     def hasTarget(self) -> bool:
         """ Returns whether or not the warrior has a target """
         return self.target is not None
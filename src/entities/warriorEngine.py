@@ -0,0 +1,511 @@
+from __future__ import annotations
+import logging
+import math
+import operator
+
+try:
+    import numpy as np
+except ImportError:  # The array engine is optional
+    np = None
+
+from src.utility.vector import Vect
+from src.utility.spatialHash import SpatialHash
+from src.window import Window
+
+
+class GroupField:
+    """ Descriptor for a warrior attribute that is stored in the arrays
+        of the warrior's engine group while it's in one,
+        and on the warrior itself otherwise """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, warrior, owner: type = None) -> any:
+        if warrior is None:
+            return self
+
+        group: WarriorGroup = warrior.engineGroup
+        if group is None:
+            return warrior.__dict__[self.name]
+
+        # Converted since Vect only works with Python numbers
+        return float(getattr(group, self.name)[warrior.engineIndex])
+
+    def __set__(self, warrior, value: any) -> None:
+        group: WarriorGroup = warrior.engineGroup
+        if group is None:
+            warrior.__dict__[self.name] = value
+        else:
+            getattr(group, self.name)[warrior.engineIndex] = value
+
+
+class PosField(GroupField):
+    """ Group field for a position, which is stored as two array columns.
+        Gives a new Vect for warriors in a group, so it has to be assigned
+        to be changed (see Entity.isPosMutable) """
+
+    def __get__(self, warrior, owner: type = None) -> any:
+        if warrior is None:
+            return self
+
+        group: WarriorGroup = warrior.engineGroup
+        if group is None:
+            return warrior.__dict__[self.name]
+
+        x, y = getattr(group, self.name)[warrior.engineIndex]
+        return Vect(float(x), float(y))
+
+    def __set__(self, warrior, value: Vect) -> None:
+        group: WarriorGroup = warrior.engineGroup
+        if group is None:
+            warrior.__dict__[self.name] = value
+            return
+
+        if value is None:
+            # No position to render from, so it's set to the current one
+            value = warrior.pos
+
+        getattr(group, self.name)[warrior.engineIndex] = (value.x, value.y)
+
+
+class TargetField(GroupField):
+    """ Group field for the target warrior,
+        stored as its index in the opponent group """
+
+    def __get__(self, warrior, owner: type = None) -> any:
+        if warrior is None:
+            return self
+
+        group: WarriorGroup = warrior.engineGroup
+        if group is None:
+            return warrior.__dict__[self.name]
+
+        index: int = group.target[warrior.engineIndex]
+        if index < 0:
+            return None
+
+        return group.opponents.warriors[index]
+
+    def __set__(self, warrior, value: any) -> None:
+        group: WarriorGroup = warrior.engineGroup
+        if group is None:
+            warrior.__dict__[self.name] = value
+            return
+
+        # Targets can only be warriors in the opponent group
+        if value is not None and value.engineGroup is group.opponents:
+            group.target[warrior.engineIndex] = value.engineIndex
+        else:
+            group.target[warrior.engineIndex] = -1
+
+
+class WarriorGroup:
+    """ Stores the simulation state of one side's warriors in NumPy arrays,
+        one row per warrior, and steps all of them at once """
+    log = logging.getLogger(__name__)
+
+    # Warrior attributes stored in the arrays while the warrior is in a group
+    STATE_FIELDS: tuple[str] = ("health", "speed", "angle",
+                                "knockbackVel", "knockbackAngle")
+
+    # Warrior stats copied into the arrays when the warrior is added
+    STAT_FIELDS: tuple[str] = ("maxSpeed", "accel", "decel",
+                               "knockbackResistance", "range")
+
+    def __init__(self, capacity: int = 64) -> None:
+        """ Creates empty arrays with the given starting capacity """
+        self.opponents: WarriorGroup = None
+        self.warriors: list = []  # Warrior objects, in the order of the rows
+        self.count: int = 0
+
+        self.pos = np.zeros((capacity, 2))
+        # Position before the last step, rendered from with a fixed timestep
+        self.prevPos = np.zeros((capacity, 2))
+        self.size = np.zeros((capacity, 2))
+        self.target = np.full(capacity, -1, dtype=np.int64)
+
+        self.attackTimer = np.zeros(capacity)
+        self.attackInterval = np.ones(capacity)
+
+        # Time each warrior's animation has been playing for,
+        # which the animation is set to when it's rendered
+        self.animTime = np.zeros(capacity)
+
+        # Warriors showing a damage tint or aoe circle, which are
+        # the only ones updated individually. Used as an ordered set
+        self.effectWarriors: dict = {}
+
+        for field in self.STATE_FIELDS + self.STAT_FIELDS:
+            setattr(self, field, np.zeros(capacity))
+
+    def getArrayNames(self) -> tuple[str]:
+        """ Returns the names of every per-warrior array """
+        return (("pos", "prevPos", "size", "target", "attackTimer",
+                 "attackInterval", "animTime")
+                + self.STATE_FIELDS + self.STAT_FIELDS)
+
+    def grow(self) -> None:
+        """ Doubles the capacity of every array """
+        for name in self.getArrayNames():
+            array = getattr(self, name)
+            newArray = np.zeros((len(array) * 2,) + array.shape[1:],
+                                dtype=array.dtype)
+            newArray[:len(array)] = array
+            setattr(self, name, newArray)
+
+    def add(self, warrior) -> None:
+        """ Copies a warrior's state into a new row
+            and attaches the warrior to it """
+        if self.count == len(self.target):
+            self.grow()
+
+        row: int = self.count
+
+        # Read the warrior's state before attaching,
+        # since attaching makes the fields read from the arrays
+        for field in self.STATE_FIELDS + self.STAT_FIELDS:
+            getattr(self, field)[row] = getattr(warrior, field)
+
+        prevPos: Vect = warrior.prevPos
+        if prevPos is None:
+            prevPos = warrior.pos
+
+        self.pos[row] = warrior.pos.toTuple()
+        self.prevPos[row] = prevPos.toTuple()
+        self.size[row] = warrior.getSize().toTuple()
+        self.attackTimer[row] = warrior.attackTimer.timer
+        self.attackInterval[row] = warrior.attackTimer.delay
+        self.animTime[row] = warrior.getAnim().getTime()
+        self.target[row] = -1
+
+        if warrior.hasEffects():
+            self.trackEffects(warrior)
+
+        warrior.engineGroup = self
+        warrior.engineIndex = row
+        self.warriors.append(warrior)
+        self.count += 1
+
+    def detach(self, row: int) -> None:
+        """ Copies a row's state back onto its warrior and detaches it,
+            so the warrior keeps working without the group """
+        warrior = self.warriors[row]
+
+        state: dict = {field: float(getattr(self, field)[row])
+                       for field in self.STATE_FIELDS}
+        pos: Vect = warrior.pos
+        prevPos: Vect = warrior.prevPos
+        target = warrior.target
+
+        self.syncAnim(warrior)
+        self.effectWarriors.pop(warrior, None)
+
+        warrior.engineGroup = None
+        warrior.engineIndex = -1
+
+        for field, value in state.items():
+            setattr(warrior, field, value)
+
+        warrior.pos = pos
+        warrior.prevPos = prevPos
+        warrior.target = target
+        warrior.attackTimer.timer = float(self.attackTimer[row])
+
+    def clear(self) -> None:
+        """ Detaches and removes every warrior """
+        for row in range(self.count):
+            self.detach(row)
+
+        self.warriors.clear()
+        self.count = 0
+
+        if self.opponents is not None:
+            self.opponents.target[:self.opponents.count] = -1
+
+    def sync(self, warriors: list) -> None:
+        """ Rebuilds the group if the list of warriors was changed outside
+            of the engine (such as being cleared or having a warrior
+            replaced), comparing the warriors themselves and not the count """
+        if (len(warriors) == self.count and
+                all(map(operator.is_, warriors, self.warriors))):
+            return
+
+        self.clear()
+        for warrior in warriors:
+            self.add(warrior)
+
+    def removeDead(self) -> list:
+        """ Removes dead warriors by moving the last rows into their place,
+            and returns the dead warriors (detached from the group) """
+        dead = np.flatnonzero(self.health[:self.count] <= 0)
+        if len(dead) == 0:
+            return []
+
+        deadWarriors: list = [self.warriors[row] for row in dead]
+        for row in dead:
+            self.detach(row)
+
+        newCount: int = self.count - len(dead)
+
+        # Dead rows inside the new count are filled by
+        # living rows from past the new count
+        holes = dead[dead < newCount]
+        alive = np.ones(self.count, dtype=bool)
+        alive[dead] = False
+        fillers = np.flatnonzero(alive[newCount:]) + newCount
+
+        for name in self.getArrayNames():
+            array = getattr(self, name)
+            array[holes] = array[fillers]
+
+        for hole, filler in zip(holes, fillers):
+            self.warriors[hole] = self.warriors[filler]
+            self.warriors[hole].engineIndex = int(hole)
+
+        del self.warriors[newCount:]
+
+        # Point opponent targets at the new rows
+        remap = np.arange(self.count)
+        remap[dead] = -1
+        remap[fillers] = holes
+
+        if self.opponents is not None and self.opponents.count > 0:
+            targets = self.opponents.target[:self.opponents.count]
+            targets[:] = np.where(targets >= 0,
+                                  remap[np.maximum(targets, 0)], -1)
+
+        self.count = newCount
+        return deadWarriors
+
+    def trackEffects(self, warrior) -> None:
+        """ Updates the warrior's effects every step until they finish """
+        self.effectWarriors[warrior] = None
+
+    def updateEffects(self, window: Window) -> None:
+        """ Updates the damage tints and aoe circles of the warriors
+            showing one, and stops updating those that have finished """
+        for warrior in list(self.effectWarriors):
+            warrior.updateEffects(window)
+
+            if not warrior.hasEffects():
+                del self.effectWarriors[warrior]
+
+    def syncAnim(self, warrior) -> None:
+        """ Sets the warrior's animation to its row's animation time """
+        warrior.getAnim().setTime(float(self.animTime[warrior.engineIndex]))
+
+    def getCenters(self) -> np.ndarray:
+        """ Returns the center positions of all warriors """
+        return self.pos[:self.count] + self.size[:self.count] / 2
+
+    def fillGrid(self, grid: SpatialHash) -> None:
+        """ Rebuilds a spatial hash with the warriors in the group,
+            using the positions in the arrays """
+        maxHalfSize: Vect = Vect()
+        if self.count > 0:
+            halfSize = self.size[:self.count].max(axis=0) / 2
+            maxHalfSize = Vect(float(halfSize[0]), float(halfSize[1]))
+
+        grid.rebuildFromCenters(self.warriors, self.getCenters().tolist(),
+                                maxHalfSize)
+
+    def findTargets(self, rows: np.ndarray, grid: SpatialHash) -> None:
+        """ Sets the target of the given rows to their closest living
+            opponent. Rows in the same cell of the opponents' grid are
+            handled as one chunk, only measuring the distances to the
+            opponents in the cells around it that could be the closest """
+        if grid.isEmpty():
+            return
+
+        cellSize: float = grid.getCellSize()
+        cells = np.floor(self.getCenters()[rows] / cellSize).astype(np.int64)
+
+        # Key: (x, y) cell, value: rows with their center in the cell
+        chunks: dict[tuple[int, int], list[int]] = {}
+        for row, cell in zip(rows.tolist(), map(tuple, cells.tolist())):
+            chunks.setdefault(cell, []).append(row)
+
+        for (cellX, cellY), chunk in chunks.items():
+            self.findTargetsInCell(np.array(chunk), cellX, cellY, grid)
+
+        # Reset attack timer on a new target
+        self.attackTimer[rows] = 0
+
+    def findTargetsInCell(self, rows: np.ndarray, cellX: int, cellY: int,
+                          grid: SpatialHash) -> None:
+        """ Sets the target of rows in the same cell to their closest
+            living opponent, searching rings of cells outwards until no
+            unsearched cell could contain anything closer for any row """
+        opponents: WarriorGroup = self.opponents
+        alive = opponents.health[:opponents.count] > 0
+        centers = self.getCenters()[rows]
+
+        cellSize: float = grid.getCellSize()
+        candidates: list[int] = []
+        # Furthest distance from a row to its closest candidate so far
+        furthest: float = math.inf
+
+        for ring in range(grid.getMaxRing(cellX, cellY) + 1):
+            # Everything in this ring is at least (ring - 1) cells away
+            if (ring - 1) * cellSize >= furthest:
+                break
+
+            candidates.extend(
+                warrior.engineIndex for warrior
+                in grid.queryRing(cellX, cellY, ring)
+                if alive[warrior.engineIndex]
+            )
+
+            # Bounded by the first ring with a candidate, which
+            # can only get lower with the candidates after it
+            if candidates and furthest == math.inf:
+                furthest = math.sqrt(
+                    self.squaredDists(centers, candidates).min(axis=1).max()
+                )
+
+        if not candidates:
+            return
+
+        # Sorted so ties go to the lowest row
+        candidates = np.unique(candidates)
+        dists = self.squaredDists(centers, candidates)
+        self.target[rows] = candidates[dists.argmin(axis=1)]
+
+    def squaredDists(self, centers: np.ndarray,
+                     candidates: list[int]) -> np.ndarray:
+        """ Returns the squared distances from each center
+            to the centers of the candidate opponent rows """
+        opponents: WarriorGroup = self.opponents
+        opponentCenters = (opponents.pos[candidates] +
+                           opponents.size[candidates] / 2)
+
+        diff = centers[:, None, :] - opponentCenters[None, :, :]
+        return np.einsum("ijk,ijk->ij", diff, diff)
+
+    def step(self, deltaTime: float, mapSize: Vect,
+             opponentGrid: SpatialHash) -> list[tuple]:
+        """ Updates targets, speed, movement, knockback, map boundaries,
+            and attack timers for every warrior in the group.
+            The opponent grid must be filled with the opponent group.
+            Returns (warrior, attack count) for warriors that attack """
+        n: int = self.count
+        if n == 0:
+            return []
+
+        self.prevPos[:n] = self.pos[:n]
+        self.animTime[:n] += deltaTime
+
+        opponents: WarriorGroup = self.opponents
+        target = self.target[:n]
+
+        # Forget targets that have died
+        if opponents.count > 0:
+            hasTarget = target >= 0
+            targetDead = opponents.health[np.maximum(target, 0)] <= 0
+            target[hasTarget & targetDead] = -1
+        else:
+            target[:] = -1
+
+        needTarget = np.flatnonzero(target < 0)
+        if len(needTarget) > 0:
+            self.findTargets(needTarget, opponentGrid)
+
+        hasTarget = target >= 0
+        pos = self.pos[:n]
+        centers = self.getCenters()
+
+        # Distance and angle to targets
+        if opponents.count > 0:
+            targetRows = np.maximum(target, 0)
+            targetCenters = (opponents.pos[targetRows] +
+                             opponents.size[targetRows] / 2)
+            diff = targetCenters - centers
+        else:
+            diff = np.zeros((n, 2))
+
+        dist = np.hypot(diff[:, 0], diff[:, 1])
+
+        # Accelerate towards targets out of range, decelerate otherwise
+        speed = self.speed[:n]
+        maxSpeed = self.maxSpeed[:n]
+        accelerating = hasTarget & (dist > self.range[:n])
+
+        accelerated = np.where(
+            speed < maxSpeed,
+            np.minimum(speed + self.accel[:n] * deltaTime, maxSpeed),
+            speed
+        )
+        decelerated = np.maximum(speed - self.decel[:n] * deltaTime, 0)
+        speed[:] = np.where(accelerating, accelerated, decelerated)
+
+        # Move towards target
+        angle = self.angle[:n]
+        angle[:] = np.where(hasTarget,
+                            np.arctan2(diff[:, 1], diff[:, 0]), angle)
+
+        pos[:, 0] += np.cos(angle) * speed * deltaTime
+        pos[:, 1] += np.sin(angle) * speed * deltaTime
+
+        # Decelerate knockback, then move by it
+        knockbackVel = self.knockbackVel[:n]
+        knockbackVel[:] = np.maximum(
+            knockbackVel - self.knockbackResistance[:n] * deltaTime, 0
+        )
+
+        knockbackAngle = self.knockbackAngle[:n]
+        pos[:, 0] += np.cos(knockbackAngle) * knockbackVel * deltaTime
+        pos[:, 1] += np.sin(knockbackAngle) * knockbackVel * deltaTime
+
+        # Lock to the map
+        np.clip(pos, 0, np.array(mapSize.toTuple()) - self.size[:n],
+                out=pos)
+
+        return self.updateAttacks(deltaTime, hasTarget)
+
+    def updateAttacks(self, deltaTime: float,
+                      hasTarget: np.ndarray) -> list[tuple]:
+        """ Updates attack timers of stopped warriors with a target,
+            returning (warrior, attack count) for those that completed """
+        n: int = self.count
+        attacking = hasTarget & (self.speed[:n] <= 0)
+
+        timer = self.attackTimer[:n]
+        timer[attacking] += deltaTime
+
+        # Amount of times each timer completed (several on low FPS)
+        attacks = np.floor(timer / self.attackInterval[:n]).astype(np.int64)
+        attacks[~attacking] = 0
+        timer -= attacks * self.attackInterval[:n]
+
+        return [(self.warriors[row], int(attacks[row]))
+                for row in np.flatnonzero(attacks)]
+
+    # Getters
+    def getCount(self) -> int: return self.count
+    def getWarriors(self) -> list: return self.warriors
+
+
+class WarriorEngine:
+    """ Optional array-backed simulation of all warriors.
+        Holds a WarriorGroup for each side, and requires NumPy """
+    log = logging.getLogger(__name__)
+
+    @staticmethod
+    def isAvailable() -> bool:
+        """ Returns whether NumPy could be imported """
+        return np is not None
+
+    def __init__(self) -> None:
+        """ Creates the groups for each side """
+        self.log.info("Using array-backed warrior engine")
+
+        self.allies: WarriorGroup = WarriorGroup()
+        self.enemies: WarriorGroup = WarriorGroup()
+
+        self.allies.opponents = self.enemies
+        self.enemies.opponents = self.allies
+
+    # Getters
+    def getAllies(self) -> WarriorGroup: return self.allies
+    def getEnemies(self) -> WarriorGroup: return self.enemies
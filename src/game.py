@@ -2,14 +2,20 @@ import logging
 
 import src.utility.utility as util
 from src.utility.image import Image
+from src.utility.atlas import Atlas
+from src.utility.preloader import Preloader
+from src.utility.animation import Animation
 from src.window import Window
 from src.tileset import Tileset
 from src.waves import Waves
 from src.entities.buildings.baseBuilding import BaseBuilding
 from src.entities.player import Player
+from src.entities.entity import Entity
 from src.entities.warrior import Warrior
-from src.entities.projectile import Projectile
+from src.entities.projectilePool import ProjectilePool
+from src.particleEmitter import ParticleEmitter
 from src.scenes.baseScene import BaseScene
+from src.staticLayer import StaticLayer
 from src.sceneManager import SceneManager
 from src.ui.elements.text import Text
 from src.ui.interfaces.baseUI import BaseUI
@@ -30,13 +36,15 @@ class Game:
         self.log.info("Initializing game")
 
         # Create database
-        self.database: Database = Database(self.constants["saves"]["saveFile"])
+        self.database: Database = self.createDatabase()
 
         # Load static data from the constants JSON file
         self.loadStatic()
 
         # Create objects
         self.window: Window = Window()
+        Atlas.build()  # Needs the window to convert the images
+        Preloader.start()  # Loads the rest while the main menu is shown
         self.errorUI: ErrorUI = ErrorUI()
 
         try:
@@ -45,12 +53,19 @@ class Game:
         except Exception:
             ErrorUI.create("Uncaught error creating the scene", self.log)
 
+    def createDatabase(self) -> Database:
+        """ Opens the save file database """
+        return Database(self.constants["saves"]["saveFile"])
+
     def loadStatic(self) -> None:
         """ Loading static data from the constants JSON file """
         self.log.info("Loading static data from constants.json")
 
         try:
             Image.loadStatic(self.constants)         # Done
+            Atlas.loadStatic(self.constants)         # Done
+            Preloader.loadStatic(self.constants)     # Done
+            Animation.loadStatic(self.constants)     # Done
             BaseUI.loadStatic(self.constants)        # Done
             Text.loadStatic(self.constants)          # Done
             ErrorUI.loadStatic(self.constants)       # Done
@@ -59,8 +74,10 @@ class Game:
             Tileset.loadStatic(self.constants)       # Done
             BaseBuilding.loadStatic(self.constants)  # Done
             Warrior.loadStatic(self.constants)       # Done
-            Projectile.loadStatic(self.constants)    # Done
+            ProjectilePool.loadStatic(self.constants)  # Done
+            ParticleEmitter.loadStatic(self.constants)  # Done
             BaseScene.loadStatic(self.constants)     # Done
+            StaticLayer.loadStatic(self.constants)   # Done
             Player.loadStatic(self.constants)        # Done
             Waves.loadStatic(self.constants)         #
 
@@ -91,18 +108,39 @@ class Game:
 
         # Allow rendering of the game if there is a recoverable error
         if self.errorUI.isHidden() or ErrorUI.isRecoverable():
-            self.update()
+            if self.window.isFixedTimestep():
+                self.fixedUpdate()
+            else:
+                self.update()
+
             self.render()
 
+    def fixedUpdate(self) -> None:
+        """ Runs as many fixed length updates as the time since the
+            previous frame allows, then sets how far to interpolate
+            entity positions towards the latest tick when rendering """
+        for _ in range(self.window.takeTicks()):
+            self.update()
+            self.window.useInputs()  # Only the first tick sees new inputs
+
+        Entity.setRenderAlpha(self.window.getInterpolation())
+
     def update(self) -> None:
         """ Each update iteration of the game loop """
         self.sceneManager.update(self.window)
 
     def render(self) -> None:
-        """ Each render iteration of the game loop """
-        self.sceneManager.render(self.window)
+        """ Each render iteration of the game loop.
+            Renders are queued and drawn together at the end """
+        self.window.startBatch()
+        try:
+            self.sceneManager.render(self.window)
+        finally:
+            self.window.endBatch()
 
     def save(self) -> None:
         """ Saves the game data """
+        Preloader.stop()  # Don't wait for assets that won't be used
+
         self.sceneManager.save()
         self.database.saveAndClose()
@@ -1,22 +1,18 @@
 from __future__ import annotations
+import pygame
 import logging
 import random
 import math
 from src.utility.image import Image
 from src.utility.vector import Vect
 from src.window import Window
-from src.utility.timer import Timer
 
 
 class Particle:
-    """ Used for enemy death particle effects and perhaps other things """
+    """ A single particle, used by ParticleList when NumPy
+        isn't installed for the ParticleEmitter """
     log = logging.getLogger(__name__)
 
-    @classmethod
-    def loadStatic(cls, constants: dict) -> None:
-        """ Loads the particle animation data from consts """
-        cls.ANIMS: dict = constants["particles"]
-
     def __init__(self, parentImg: Image, pos: Vect, size: Vect,
                  speed: float, duration: float) -> None:
         """ Initialize particle with a random section from the given image """
@@ -25,39 +21,41 @@ class Particle:
 
         # Random position within the parent image for the particle to use
         randPos: Vect = Vect(
-            random.randint(0, parentSize.x - size.x),
-            random.randint(0, parentSize.y - size.y)
+            random.randint(0, int(parentSize.x - size.x)),
+            random.randint(0, int(parentSize.y - size.y))
         )
 
         # Create the particle image from the parent image
         self.image: Image = parentImg.getSection(randPos, size)
 
         self.pos = pos + randPos
-        self.timer = Timer(duration)
         self.speed = speed
 
+        # Time alive and time until the particle is gone
+        self.age: float = 0
+        self.duration: float = duration
+
         centerPos = parentSize / 2
         if centerPos == randPos:
             # Random angle if the random pos was in the center
             self.angle = math.radians(random.randint(0, 359))
         else:
-            # Angle from randPos to the center of the image
+            # Angle from the center of the image to randPos
             self.angle = centerPos.angle(randPos)
 
         self.opacity = 255
 
-    def update(self, window: Window) -> None:
+    def update(self, deltaTime: float) -> None:
         """ Moves the particle along and fades it out """
-        self.timer.update(window)
+        self.age += deltaTime
 
         # Opacity and speed die down based on how much time is left
-        percentLeft: float = 1 - self.timer.getPercentDone()
+        percentLeft: float = max(1 - self.age / self.duration, 0)
         self.opacity = int(255 * percentLeft)
         speed = self.speed * percentLeft
 
         # Movement of the particle
-        moveAmount: Vect = Vect.angleMove(self.angle) * \
-            speed * window.getDeltaTime()
+        moveAmount: Vect = Vect.angleMove(self.angle) * speed * deltaTime
 
         self.pos += moveAmount
 
@@ -66,17 +64,9 @@ class Particle:
         self.image.setAlpha(self.opacity)
         surface.render(self.image, self.pos + offset)
 
+    def getRect(self) -> pygame.Rect:
+        return Vect.toRect(self.pos, self.image.getSize())
+
     def isDone(self) -> bool:
         """ Returns True if the particle has finished """
-        return self.timer.isDone()
-
-    @staticmethod
-    def generate(amount: int, parentImg: Image, pos: Vect, size: Vect,
-                 speed: float, duration: float) -> list[Particle]:
-        """ Generates a list of particles """
-        particles: list = []
-
-        for _ in range(amount):
-            particles.append(Particle(parentImg, pos, size, speed, duration))
-
-        return particles
+        return self.age >= self.duration
@@ -0,0 +1,214 @@
+import logging
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # Particle objects are used instead
+    np = None
+
+from src.utility.animation import Animation
+from src.utility.image import Image
+from src.utility.vector import Vect
+from src.window import Window
+from src.ui.interfaces.errorUI import ErrorUI
+
+
+class ParticleEmitter:
+    """ Stores every particle of a scene in NumPy arrays, so they are
+        moved, faded, and removed all at once. Each particle is a small
+        section of the frame that emitted it, which flies away from the
+        center of the frame while slowing down and fading out.
+        Requires NumPy, otherwise a ParticleList is used instead """
+    log = logging.getLogger(__name__)
+
+    @staticmethod
+    def isAvailable() -> bool:
+        """ Returns whether NumPy could be imported """
+        return np is not None
+
+    @classmethod
+    def loadStatic(cls, constants: dict) -> None:
+        """ Loads the max number of particles from consts """
+        try:
+            # Most particles alive at once in each scene. Particles
+            # emitted past the budget are dropped
+            cls.BUDGET: int = constants["particles"]["budget"]
+        except KeyError:
+            ErrorUI.create("Unable to find particles -> budget in "
+                           "constants. Defaulting to 4000",
+                           cls.log, recoverable=True)
+            cls.BUDGET: int = 4000
+
+    def __init__(self, capacity: int = 256) -> None:
+        """ Creates empty particle arrays with the given capacity """
+        self.count: int = 0
+
+        # Surfaces that particles are sections of, where the index
+        # is the source ID. Key: surface, value: source ID
+        self.sources: list[pygame.Surface] = []
+        self.sourceIds: dict[pygame.Surface, int] = {}
+
+        # Subsurfaces of each source covering all of it with an alpha set,
+        # so particles can fade without changing or copying the source.
+        # Key: opacity, value: subsurface with that alpha
+        self.fades: list[dict[int, pygame.Surface]] = []
+
+        self.pos = np.zeros((capacity, 2))  # Top left positions
+        self.angle = np.zeros(capacity)
+        self.speed = np.zeros(capacity)  # Starting speed
+
+        # Time alive and time until the particle is gone
+        self.age = np.zeros(capacity)
+        self.duration = np.ones(capacity)
+
+        # Source ID and the area (x, y, width, height) of the source
+        self.sourceId = np.zeros(capacity, dtype=np.int64)
+        self.area = np.zeros((capacity, 4), dtype=np.int64)
+
+    def getArrayNames(self) -> tuple[str]:
+        """ Returns the names of every per-particle array """
+        return ("pos", "angle", "speed", "age", "duration",
+                "sourceId", "area")
+
+    def grow(self) -> None:
+        """ Doubles the capacity of every array """
+        for name in self.getArrayNames():
+            array = getattr(self, name)
+            newArray = np.ones((len(array) * 2,) + array.shape[1:],
+                               dtype=array.dtype)
+            newArray[:len(array)] = array
+            setattr(self, name, newArray)
+
+    def getSourceId(self, source: pygame.Surface) -> int:
+        """ Returns the ID of a source surface,
+            adding it if it hasn't been used before """
+        if source not in self.sourceIds:
+            self.sourceIds[source] = len(self.sources)
+            self.sources.append(source)
+            self.fades.append({})
+
+        return self.sourceIds[source]
+
+    def getFaded(self, sourceId: int, opacity: int) -> pygame.Surface:
+        """ Returns the source surface with the given opacity """
+        fades: dict[int, pygame.Surface] = self.fades[sourceId]
+
+        if opacity not in fades:
+            source: pygame.Surface = self.sources[sourceId]
+            fades[opacity] = source.subsurface(source.get_rect())
+            fades[opacity].set_alpha(opacity)
+
+        return fades[opacity]
+
+    def emit(self, amount: int, anim: Animation, pos: Vect, size: Vect,
+             speed: float, duration: float) -> None:
+        """ Emits particles from random sections of the animation's
+            current frame, which is drawn at the given pos """
+        # Only emit as many as fit in the budget
+        amount = min(amount, self.BUDGET - self.count)
+        if amount <= 0:
+            return
+
+        while self.count + amount > len(self.age):
+            self.grow()
+
+        rows = slice(self.count, self.count + amount)
+
+        frameSize: Vect = anim.getSize()
+        frame: int = min(anim.getCurrentFrame(), anim.getFrameCount() - 1)
+        frameRect: pygame.Rect = anim.getFrameRect(frame)
+
+        # Random positions within the frame for the particles to use
+        randX = np.random.randint(0, int(frameSize.x - size.x) + 1, amount)
+        randY = np.random.randint(0, int(frameSize.y - size.y) + 1, amount)
+
+        # Angle from the center of the frame to the random pos,
+        # or a random angle if the random pos was in the center
+        centerX, centerY = frameSize.x / 2, frameSize.y / 2
+        angle = np.arctan2(randY - centerY, randX - centerX)
+        centered = (randX == centerX) & (randY == centerY)
+        angle[centered] = np.radians(
+            np.random.randint(0, 360, int(centered.sum()))
+        )
+
+        self.pos[rows, 0] = pos.x + randX
+        self.pos[rows, 1] = pos.y + randY
+        self.angle[rows] = angle
+        self.speed[rows] = speed
+        self.age[rows] = 0
+        self.duration[rows] = duration
+
+        self.sourceId[rows] = self.getSourceId(anim.getSpritesheet().getSurf())
+        self.area[rows, 0] = frameRect.x + randX
+        self.area[rows, 1] = frameRect.y + randY
+        self.area[rows, 2:] = size.toTuple()
+
+        self.count += amount
+
+    def update(self, deltaTime: float) -> None:
+        """ Moves the particles along, slowing them down as they fade
+            out, and removes those that have finished """
+        n: int = self.count
+        if n == 0:
+            return
+
+        self.age[:n] += deltaTime
+
+        # Speed dies down based on how much time is left
+        percentLeft = 1 - self.age[:n] / self.duration[:n]
+        speed = self.speed[:n] * percentLeft
+
+        angle = self.angle[:n]
+        self.pos[:n, 0] += np.cos(angle) * speed * deltaTime
+        self.pos[:n, 1] += np.sin(angle) * speed * deltaTime
+
+        # Remove finished particles, packing the rest together in order
+        keep = self.age[:n] < self.duration[:n]
+        newCount: int = int(keep.sum())
+
+        if newCount == n:
+            return
+
+        for name in self.getArrayNames():
+            array = getattr(self, name)
+            array[:newCount] = array[:n][keep]
+
+        self.count = newCount
+
+    def render(self, surface: Window | Image, offset: Vect = Vect(),
+               view: pygame.Rect = None) -> None:
+        """ Renders every particle at its opacity. If given,
+            only particles overlapping the view are rendered """
+        n: int = self.count
+        pos = self.pos[:n]
+        area = self.area[:n]
+        sourceId = self.sourceId[:n]
+
+        # Opacity dies down based on how much time is left
+        opacity = (255 * (1 - self.age[:n] / self.duration[:n])).astype(int)
+
+        if view is not None:
+            bottomRight = pos + area[:, 2:]
+            onScreen = ((pos[:, 0] < view.right) &
+                        (pos[:, 1] < view.bottom) &
+                        (bottomRight[:, 0] > view.left) &
+                        (bottomRight[:, 1] > view.top))
+
+            pos, area = pos[onScreen], area[onScreen]
+            sourceId, opacity = sourceId[onScreen], opacity[onScreen]
+
+        # Submitted to the surface all at once
+        blits: list[tuple] = []
+        offsetX, offsetY = offset.x, offset.y
+
+        for (x, y), area, sourceId, opacity in zip(pos.tolist(),
+                                                   area.tolist(),
+                                                   sourceId.tolist(),
+                                                   opacity.tolist()):
+            blits.append((self.getFaded(sourceId, opacity),
+                          (x + offsetX, y + offsetY), area))
+
+        surface.renderMany(blits)
+
+    # Getters
+    def getCount(self) -> int: return self.count
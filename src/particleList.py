@@ -0,0 +1,55 @@
+import logging
+import pygame
+
+from src.particle import Particle
+from src.particleEmitter import ParticleEmitter
+from src.utility.animation import Animation
+from src.utility.image import Image
+from src.utility.vector import Vect
+from src.window import Window
+
+
+class ParticleList:
+    """ Stores every particle as its own Particle object.
+        Has the same methods as ParticleEmitter, and is used
+        instead of it when NumPy isn't installed """
+    log = logging.getLogger(__name__)
+
+    def __init__(self) -> None:
+        self.particles: list[Particle] = []
+
+    def emit(self, amount: int, anim: Animation, pos: Vect, size: Vect,
+             speed: float, duration: float) -> None:
+        """ Emits particles from random sections of the animation's
+            current frame, which is drawn at the given pos """
+        # Only emit as many as fit in the budget
+        amount = min(amount, ParticleEmitter.BUDGET - len(self.particles))
+
+        frame: int = min(anim.getCurrentFrame(), anim.getFrameCount() - 1)
+        parentImg: Image = anim.getFrame(frame)
+
+        for _ in range(amount):
+            self.particles.append(
+                Particle(parentImg, pos, size, speed, duration)
+            )
+
+    def update(self, deltaTime: float) -> None:
+        """ Moves the particles along, and removes those that have finished """
+        for particle in self.particles:
+            particle.update(deltaTime)
+
+        self.particles[:] = [  # list comprehension in place
+            particle for particle in self.particles
+            if not particle.isDone()
+        ]
+
+    def render(self, surface: Window | Image, offset: Vect = Vect(),
+               view: pygame.Rect = None) -> None:
+        """ Renders every particle at its opacity. If given,
+            only particles overlapping the view are rendered """
+        for particle in self.particles:
+            if view is None or view.colliderect(particle.getRect()):
+                particle.render(surface, offset)
+
+    # Getters
+    def getCount(self) -> int: return len(self.particles)
@@ -11,6 +11,7 @@ from src.utility.database import Database
 from src.ui.interfaces.loseUI import LoseUI
 from src.ui.interfaces.mainMenu import MainMenu
 from src.entities.player import Player
+from src.entities.warrior import Warrior
 
 
 class SceneState(enum.Enum):
@@ -51,6 +52,7 @@ class SceneManager:
         for scene in self.scenes.values():
             scene.stopSounds()
 
+        oldScenes: list[BaseScene] = list(self.scenes.values())
         musicVol: float = self.mainMenu.getMusicVol()
 
         # Dictionary of all the scenes
@@ -59,6 +61,14 @@ class SceneManager:
             SceneState.DUNGEON: DungeonScene("dungeon", 0, self.db)
         }
 
+        # Released after the new scenes are made, so sounds used
+        # by both the old and new scenes aren't loaded again
+        for scene in oldScenes:
+            scene.releaseSounds()
+
+        # Pooled warriors from the old dungeon aren't needed anymore
+        Warrior.clearPool()
+
         Player.resetResources()
 
     def update(self, window: Window) -> None:
@@ -136,9 +146,10 @@ class SceneManager:
         self.updateResources(window)
 
     def updateResources(self, window: Window) -> None:
-        """ Update wave number and resource numbers shown """
-        waveNum: int = self.scenes[SceneState.DUNGEON].getWaveNum()
-        self.resourcesUI.update(window, waveNum)
+        """ Update wave number, enemies left, and resource numbers shown """
+        dungeon: DungeonScene = self.scenes[SceneState.DUNGEON]
+        self.resourcesUI.update(window, dungeon.getWaveNum(),
+                                dungeon.getEnemiesLeft())
 
     def testSwitchScene(self, window: Window) -> None:
         """ Tests if the scene should be switched """
@@ -160,6 +171,10 @@ class SceneManager:
         self.loseUI.render(surface)
         self.mainMenu.render(surface)
 
+    # Getters
+    def getScene(self, state: SceneState) -> BaseScene:
+        return self.scenes[state]
+
     def save(self) -> None:
         """ Saves the game """
         self.mainMenu.saveVolume()
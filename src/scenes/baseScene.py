@@ -3,10 +3,13 @@ import logging
 
 from src.tileset import Tileset
 from src.entities.player import Player
+from src.entities.entity import Entity
 from src.utility.vector import Vect
 from src.utility.image import Image
+from src.utility.sound import Sound
 from src.window import Window
-from src.particle import Particle
+from src.particleEmitter import ParticleEmitter
+from src.particleList import ParticleList
 from src.ui.interfaces.errorUI import ErrorUI
 
 
@@ -32,15 +35,18 @@ class BaseScene:
         self.player: Player = Player(self.tileset.getPlayerStart())
 
         self.cameraOffset: Vect = Vect()
+        self.prevCameraOffset: Vect = Vect()  # Offset before last update
 
-        self.particles: list[Particle] = []
+        # Particle objects are used if NumPy isn't installed
+        if ParticleEmitter.isAvailable():
+            self.particles: ParticleEmitter = ParticleEmitter()
+        else:
+            self.particles: ParticleList = ParticleList()
 
         # music
         try:
-            self.music = pygame.mixer.Sound(
-                self.tileset.getData()["music"]
-            )
-            self.music.set_volume(musicVol)
+            self.music: Sound = Sound(self.tileset.getData()["music"])
+            self.music.setVolume(musicVol)
             self.music.play(-1)
         except KeyError:
             ErrorUI.create(f"Unable to find music in map: {mapFolderName}",
@@ -64,19 +70,26 @@ class BaseScene:
     def updateMusicVolume(self, musicVol: float) -> None:
         """ Update music volume """
         if self.music is not None:
-            self.music.set_volume(musicVol)
+            self.music.setVolume(musicVol)
 
     def stopSounds(self) -> None:
         """ Stop all sounds """
         if self.music is not None:
             self.music.stop()
 
+    def releaseSounds(self) -> None:
+        """ Releases all sounds when the scene is no longer used """
+        if self.music is not None:
+            self.music.release()
+
     def updatePlayer(self, window: Window) -> None:
         """ Update player """
         self.player.update(window, self.tileset)
 
     def updateCameraPos(self, window: Window) -> None:
         """ Update camera position """
+        self.prevCameraOffset = self.cameraOffset.copy()
+
         winSize = window.getSize()
         tileSize = self.tileset.getSize()
 
@@ -102,12 +115,7 @@ class BaseScene:
 
     def updateParticles(self, window: Window) -> None:
         """ Update particles """
-        for particle in self.particles:
-            particle.update(window)
-
-        # Remove particles that are done
-        self.particles[:] = [particle for particle in self.particles
-                             if not particle.isDone()]
+        self.particles.update(window.getDeltaTime())
 
     def render(self, surface: Window | Image) -> None:
         """ Render scene objects """
@@ -117,24 +125,39 @@ class BaseScene:
 
     def renderTileset(self, surface: Window | Image) -> None:
         """ Render the tileset """
-        self.tileset.render(surface, -self.cameraOffset)
+        self.tileset.render(surface, -self.getRenderCamOffset())
 
     def renderPlayer(self, surface: Window | Image) -> None:
         """ Render the player """
-        self.player.render(surface, -self.cameraOffset)
+        self.player.render(surface, -self.getRenderCamOffset())
 
     def renderParticles(self, surface: Window | Image) -> None:
-        """ Render particles """
-        for particle in self.particles:
-            particle.render(surface, -self.cameraOffset)
+        """ Render particles that are on screen """
+        self.particles.render(surface, -self.getRenderCamOffset(),
+                              self.getViewRect(surface))
+
+    def getRenderCamOffset(self) -> Vect:
+        """ Returns the camera offset between the previous and current
+            offset, matching where entities are rendered """
+        alpha: float = Entity.renderAlpha
+        if alpha == 1:
+            return self.cameraOffset
+
+        return (self.prevCameraOffset +
+                (self.cameraOffset - self.prevCameraOffset) * alpha)
+
+    def getViewRect(self, surface: Window | Image) -> pygame.Rect:
+        """ Returns the area of the map shown on the surface, padded by
+            a tile so entities are drawn as soon as they start to show """
+        view: pygame.Rect = Vect.toRect(self.getRenderCamOffset(),
+                                        surface.getSize())
+        return view.inflate(Tileset.TILE_SIZE.x * 2, Tileset.TILE_SIZE.y * 2)
 
     # Getters
     def getCamOffset(self) -> Vect: return self.cameraOffset
     def getPlayer(self) -> Player: return self.player
+    def getParticleCount(self) -> int: return self.particles.getCount()
     def getTileset(self) -> Tileset: return self.tileset
-    def getParticles(self) -> list[Particle]: return self.particles
 
-    # Setters
-    def addParticles(self, particles: list[Particle]) -> None:
-        """ Adds particles to the scene """
-        self.particles.extend(particles)
+    def getParticles(self) -> ParticleEmitter | ParticleList:
+        return self.particles
@@ -1,4 +1,5 @@
 import logging
+import pygame
 from src.scenes.baseScene import BaseScene
 from src.entities.buildings.baseBuilding import BaseBuilding
 from src.entities.buildings.storage import Storage
@@ -9,6 +10,8 @@ from src.utility.image import Image
 from src.ui.interfaces.buildingShop import BuildingShop
 from src.ui.interfaces.upgradeUI import UpgradeUI
 from src.utility.vector import Vect
+from src.tileset import Tileset
+from src.staticLayer import StaticLayer
 
 
 class BuildingsScene(BaseScene):
@@ -33,6 +36,9 @@ class BuildingsScene(BaseScene):
 
         self.placingBuilding: bool = False
 
+        # Tileset and idle buildings, cached together
+        self.layer: StaticLayer = StaticLayer(super().getTileset())
+
         # Create build range circle image
         radius: int = BaseBuilding.BUILD_REACH
         size: Vect = Vect(radius * 2)  # Size of the circle image
@@ -65,12 +71,15 @@ class BuildingsScene(BaseScene):
         """ Updates the UI elements """
         super().updateUI(window, sfxVol, musicVol)
         self.buildingShop.update(window, self.placingBuilding)
-        self.upgradeUI.update(window, super().getTileset())
 
-        # Update building sfx sound
+        # Update building sfx sound, and deselect them to be
+        # selected again by the upgrade UI
         for building in self.buildings:
             building.updateSound(super().getPlayer(),
                                  sfxVol)
+            building.deselect()
+
+        self.upgradeUI.update(window, super().getTileset())
 
     def stopSounds(self) -> None:
         """ Stops all sounds """
@@ -78,6 +87,12 @@ class BuildingsScene(BaseScene):
         for building in self.buildings:
             building.stopSound()
 
+    def releaseSounds(self) -> None:
+        """ Releases all sounds """
+        super().releaseSounds()
+        for building in self.buildings:
+            building.releaseSound()
+
     def updateBuildings(self, window: Window, sfxVol: float) -> None:
         """ Updates all buildings """
         for building in self.buildings:
@@ -87,7 +102,7 @@ class BuildingsScene(BaseScene):
 
             # Particles
             if building.isSpawningParticles():
-                super().addParticles(building.getParticles())
+                building.emitParticles(super().getParticles())
 
         # Remove buildings that were sold
         self.buildings[:] = [
@@ -136,6 +151,26 @@ class BuildingsScene(BaseScene):
         newBuilding: objType = objType(buildingType)
         self.buildings.append(newBuilding)
 
+    def buildAt(self, buildingType: str, tilePos: Vect) -> bool:
+        """ Places a building at the tile position without the player
+            placing it. Returns False if the building doesn't fit there """
+        tileset: Tileset = super().getTileset()
+        if not BaseBuilding.testPlacement(buildingType, tilePos, tileset):
+            return False
+
+        self.placeBuilding(buildingType)
+        building: BaseBuilding = self.buildings[-1]
+        building.setTilePos(tilePos)
+
+        # Can't be placed on top of the player
+        if building.collide(super().getPlayer()):
+            building.releaseSound()
+            self.buildings.pop()
+            return False
+
+        building.place(tileset)
+        return True
+
     def isPlacingBuilding(self) -> bool:
         """ Test if the user is placing a building """
         for building in self.buildings:
@@ -152,23 +187,32 @@ class BuildingsScene(BaseScene):
             playerPos: Vect = super().getPlayer().getCenterPos()
             topLeft: Vect = playerPos - BaseBuilding.BUILD_REACH
 
-            topLeft -= super().getCamOffset()
+            topLeft -= super().getRenderCamOffset()
 
             surface.render(self.buildRangeCircle, topLeft)
 
     def render(self, surface: Window | Image) -> None:
         """ Renders the building scene in order """
-        super().renderTileset(surface)
+        # Tileset and idle buildings
+        self.layer.update(surface, super().getRenderCamOffset(),
+                          self.buildings)
+        self.layer.render(surface, -super().getRenderCamOffset())
+
         super().renderParticles(surface)
 
         self.drawPlaceRange(surface)
 
-        # Render buildings
+        # Render tinted buildings that are on screen
+        view: pygame.Rect = super().getViewRect(surface)
         for building in self.buildings:
-            building.render(surface, -super().getCamOffset())
+            if not building.isIdle() and view.colliderect(building.getRect()):
+                building.render(surface, -super().getRenderCamOffset())
 
         super().renderPlayer(surface)
 
         # Render UIs
         self.buildingShop.render(surface)
         self.upgradeUI.render(surface)
+
+    # Getters
+    def getBuildings(self) -> list[BaseBuilding]: return self.buildings
@@ -1,9 +1,14 @@
 import logging
+import pygame
 from src.scenes.baseScene import BaseScene
 from src.window import Window
 from src.entities.warrior import Warrior
-from src.entities.projectile import Projectile
+from src.entities.projectilePool import ProjectilePool
+from src.entities.projectileList import ProjectileList
+from src.entities.warriorEngine import WarriorEngine
 from src.utility.image import Image
+from src.utility.vector import Vect
+from src.utility.spatialHash import SpatialHash
 from src.tileset import Tileset
 from src.waves import Waves
 from src.utility.database import Database
@@ -26,8 +31,31 @@ class DungeonScene(BaseScene):
         self.enemies: list[Warrior] = []
         self.allies: list[Warrior] = []
 
-        # Projectiles fired by warriors
-        self.projectiles: list[Projectile] = []
+        # Grids of warrior positions, rebuilt every update,
+        # used by warriors to find the closest opponent
+        self.enemyGrid: SpatialHash = SpatialHash(Warrior.GRID_CELL_SIZE)
+        self.allyGrid: SpatialHash = SpatialHash(Warrior.GRID_CELL_SIZE)
+
+        # Array-backed simulation of the warriors, if enabled
+        self.engine: WarriorEngine = None
+        if Warrior.ARRAY_ENGINE:
+            self.engine = WarriorEngine()
+
+        # Warriors that were in hearing range of the player
+        # the last time sound volumes were updated
+        self.audibleWarriors: set[Warrior] = set()
+
+        # Warriors removed in the last update. They are only recycled
+        # after every other warrior has updated once more and dropped
+        # them as a target, so a respawned warrior isn't targeted
+        self.deadWarriors: list[Warrior] = []
+
+        # Projectiles fired by warriors, which are
+        # objects if NumPy isn't installed
+        if ProjectilePool.isAvailable():
+            self.projectiles: ProjectilePool = ProjectilePool()
+        else:
+            self.projectiles: ProjectileList = ProjectileList()
 
         # List of tile coords where enemies can spawn,
         # and where allies can spawn from data/maps/dungeon/data.json
@@ -48,22 +76,25 @@ class DungeonScene(BaseScene):
             and updates projectiles"""
         super().update(window, sfxVol, musicVol)
 
-        self.updateWarriors(window, sfxVol)
+        self.updateWarriors(window)
         self.spawnQueue()
 
         self.updateProjectiles(window)
+        self.updateWarriorSounds(sfxVol)
 
         self.waves.update(window, self.allies, self.enemies)
 
+        # The waves clear the allies between waves, which
+        # the grid has to match since it's used for rendering
+        if len(self.allies) == 0:
+            self.allyGrid.clear()
+
     def updateUI(self, window: Window, sfxVol: float, musicVol: float) -> None:
         """ Updates UIs """
         super().updateUI(window, sfxVol, musicVol)
 
         # Update warrior sound volume
-        for ally in self.allies:
-            ally.updateSounds(super().getPlayer(), sfxVol)
-        for enemy in self.enemies:
-            enemy.updateSounds(super().getPlayer(), sfxVol)
+        self.updateWarriorSounds(sfxVol)
 
     def stopSounds(self) -> None:
         """ Stops all sounds """
@@ -75,19 +106,57 @@ class DungeonScene(BaseScene):
         for enemy in self.enemies:
             enemy.stopSounds()
 
-    def updateWarriors(self, window: Window, sfxVol: float) -> None:
+    def releaseSounds(self) -> None:
+        """ Releases all sounds, except for pooled warriors'
+            which are released when the pool is cleared """
+        super().releaseSounds()
+
+        for warrior in self.allies + self.enemies + self.deadWarriors:
+            warrior.releaseSounds()
+
+    def updateWarriorSounds(self, sfxVol: float) -> None:
+        """ Updates the sound volumes of the warriors in hearing range
+            of the player, and silences those that have left the range """
+        player: Player = super().getPlayer()
+        playerPos = player.getCenterPos()
+
+        audible: set[Warrior] = set(
+            self.allyGrid.queryCircle(playerPos, Player.HEARING_RANGE) +
+            self.enemyGrid.queryCircle(playerPos, Player.HEARING_RANGE)
+        )
+
+        # Dead warriors are left alone so their last hit sound can finish
+        for warrior in self.audibleWarriors - audible:
+            if not warrior.isDead():
+                warrior.setSoundVolume(0)
+
+        for warrior in audible:
+            warrior.updateSounds(player, sfxVol)
+
+        self.audibleWarriors = audible
+
+    def updateWarriors(self, window: Window) -> None:
         """ Updates warriors (both allies and enemies) """
+        if self.engine is not None:
+            self.updateEngineWarriors(window)
+            return
+
         tileset: Tileset = super().getTileset()
-        player: Player = super().getPlayer()
 
-        # Updating warriors with the opponent list of warriors
+        # Updating warriors with the opponent grid of warriors.
+        # Each grid is rebuilt right before the other side uses it,
+        # so that it has the positions the warriors moved to this frame
+        self.enemyGrid.rebuild(self.enemies)
         for ally in self.allies:
-            ally.update(window, tileset, self.enemies, player, sfxVol)
-            ally.updateAttack(window, self.enemies, self.projectiles)
+            ally.update(window, tileset, self.enemyGrid)
+            ally.updateAttack(window, self.enemyGrid, self.projectiles)
 
+        self.allyGrid.rebuild(self.allies)
         for enemy in self.enemies:
-            enemy.update(window, tileset, self.allies, player, sfxVol)
-            enemy.updateAttack(window, self.allies, self.projectiles)
+            enemy.update(window, tileset, self.allyGrid)
+            enemy.updateAttack(window, self.allyGrid, self.projectiles)
+
+        self.recycleDead()
 
         # Remove dead warriors through list comprehension in place
         self.allies[:] = [ally for ally in self.allies
@@ -96,50 +165,97 @@ class DungeonScene(BaseScene):
         self.enemies[:] = [enemy for enemy in self.enemies
                            if not self.warriorDead(enemy)]
 
+    def updateEngineWarriors(self, window: Window) -> None:
+        """ Updates warriors using the array engine, which moves and
+            animates every warrior on a side at once. Only warriors that
+            attack, die, or show an effect are handled individually """
+        mapSize = super().getTileset().getSize()
+        allies, enemies = self.engine.getAllies(), self.engine.getEnemies()
+
+        # The waves can clear the allies list between waves
+        allies.sync(self.allies)
+        enemies.sync(self.enemies)
+
+        allies.updateEffects(window)
+        enemies.updateEffects(window)
+
+        # Same order as without the engine: allies move and attack,
+        # then enemies move and attack
+        deltaTime: float = window.getDeltaTime()
+
+        enemies.fillGrid(self.enemyGrid)
+        for ally, attacks in allies.step(deltaTime, mapSize, self.enemyGrid):
+            for _ in range(attacks):
+                ally.attack(self.enemyGrid, self.projectiles)
+
+        allies.fillGrid(self.allyGrid)
+        for enemy, attacks in enemies.step(deltaTime, mapSize, self.allyGrid):
+            for _ in range(attacks):
+                enemy.attack(self.allyGrid, self.projectiles)
+
+        self.recycleDead()
+
+        # Remove dead warriors, which are detached from the engine
+        for warrior in allies.removeDead() + enemies.removeDead():
+            self.warriorDead(warrior)
+
+        self.allies[:] = allies.getWarriors()
+        self.enemies[:] = enemies.getWarriors()
+
     def warriorDead(self, warrior: Warrior) -> bool:
         """ Returns True if the warrior is dead.
-            Also adds death particles to the scene """
+            Also adds death particles to the scene
+            and queues the warrior to be recycled """
         if warrior.isDead():
             # Add death particles
-            deathParticles = warrior.getDeathParticles()
-            super().addParticles(deathParticles)
+            warrior.emitDeathParticles(super().getParticles())
 
+            self.deadWarriors.append(warrior)
             return True
 
         return False
 
+    def recycleDead(self) -> None:
+        """ Adds the warriors removed in the last update to the pool """
+        Warrior.recycle(self.deadWarriors)
+        self.deadWarriors = []
+
+    def rebuildGrids(self) -> None:
+        """ Rebuilds both warrior grids with the current positions """
+        if self.engine is not None:
+            self.engine.getAllies().fillGrid(self.allyGrid)
+            self.engine.getEnemies().fillGrid(self.enemyGrid)
+        else:
+            self.allyGrid.rebuild(self.allies)
+            self.enemyGrid.rebuild(self.enemies)
+
     def updateProjectiles(self, window: Window) -> None:
         """ Updates the projectiles, removing those out of bounds """
         tileset = super().getTileset()
 
-        for projectile in self.projectiles:
-            projectile.update(window, tileset)
+        # Warriors have moved and died since the grids were last built
+        self.rebuildGrids()
 
-            # Pick the list of warriors to test for
-            # collisions on based on the projectile data
-            if projectile.hitsEnemies():
-                warriorsList = self.enemies
-            else:
-                warriorsList = self.allies
+        self.projectiles.update(window.getDeltaTime(), tileset.getSize())
 
-            # Test for hits
-            projectile.collisions(warriorsList)
-
-        # Only keep projectiles that are in the bounds
-        self.projectiles[:] = [  # list comprehension in place
-            projectile for projectile in self.projectiles
-            if not projectile.shouldRemove()
-        ]
+        # Test for hits, then only keep projectiles
+        # that are in the bounds and haven't hit anything
+        self.projectiles.collisions(self.allyGrid, self.enemyGrid)
+        self.projectiles.removeFinished()
 
     def spawnQueue(self) -> None:
         """ Spawns queued warrior types """
         # Iterate through spawn queue and add them to the correct list
         for warrior in self.queuedAllies:
             self.allies.append(warrior)
+            if self.engine is not None:
+                self.engine.getAllies().add(warrior)
         self.queuedAllies.clear()
 
         for warrior in self.waves.getSpawnQueue():
             self.enemies.append(warrior)
+            if self.engine is not None:
+                self.engine.getEnemies().add(warrior)
         self.waves.clearSpawnQueue()
 
     def render(self, surface: Window | Image) -> None:
@@ -151,19 +267,29 @@ class DungeonScene(BaseScene):
         super().renderParticles(surface)
 
     def renderWarriors(self, surface: Window | Image) -> None:
-        """ Renders all warriors """
-        for ally in self.allies:
-            ally.render(surface, -super().getCamOffset())
-
-        for enemy in self.enemies:
-            enemy.render(surface, -super().getCamOffset())
+        """ Renders the warriors that are on screen, found using the
+            warrior grids, in the order they were spawned """
+        # Widened so warriors just off screen still render their aoe circles
+        view: pygame.Rect = super().getViewRect(surface).inflate(
+            Warrior.MAX_AOE_RANGE * 2, Warrior.MAX_AOE_RANGE * 2
+        )
+        offset: Vect = -super().getRenderCamOffset()
+
+        for grid in (self.allyGrid, self.enemyGrid):
+            for warrior in sorted(grid.queryRect(view),
+                                  key=Warrior.getSpawnOrder):
+                warrior.render(surface, offset)
 
     def renderProjectiles(self, surface: Window | Image) -> None:
-        """ Renders projectiles """
-        for projectile in self.projectiles:
-            projectile.render(surface, -super().getCamOffset())
+        """ Renders projectiles that are on screen """
+        self.projectiles.render(surface, -super().getRenderCamOffset(),
+                                super().getViewRect(surface))
 
     # Getters
     def hasLost(self) -> bool: return self.waves.hasLost()
     def getWaveNum(self) -> int: return self.waves.getWaveNum()
+    def getEnemiesLeft(self) -> int: return self.waves.getEnemiesLeft()
+    def getAllyCount(self) -> int: return len(self.allies)
+    def getEnemyCount(self) -> int: return len(self.enemies)
+    def getProjectileCount(self) -> int: return self.projectiles.getCount()
     def getWaveHighscore(self) -> int: return self.waves.getHighscore()
@@ -0,0 +1,160 @@
+import logging
+from time import perf_counter
+
+from src.game import Game
+from src.sceneManager import SceneState
+from src.scenes.buildingsScene import BuildingsScene
+from src.scenes.dungeonScene import DungeonScene
+from src.entities.player import Player
+from src.utility.vector import Vect
+from src.utility.database import Database
+from src.utility.preloader import Preloader
+from src.tileset import Tileset
+from src.ui.interfaces.errorUI import ErrorUI
+
+
+class Simulation(Game):
+    """ Runs the game without rendering or player input, on a synthetic
+        clock, as fast as possible. Used to measure simulation throughput
+        on machines without a display (using SDL's dummy drivers) """
+    log = logging.getLogger(__name__)
+
+    def loadStatic(self) -> None:
+        """ Loads the game's static data and the simulation settings """
+        super().loadStatic()
+
+        try:
+            data: dict = self.constants["simulation"]
+            self.TICK_RATE: int = data["tickRate"]
+            self.MAX_TICKS: int = data["maxTicks"]
+            self.REPORT_INTERVAL: int = data["reportInterval"]
+            # Buildings placed near the player at the start
+            self.BUILDINGS: list[str] = data["buildings"]
+            # Whether to upgrade buildings whenever it can be afforded
+            self.AUTO_UPGRADE: bool = data["autoUpgrade"]
+        except KeyError:
+            ErrorUI.create("Unable to find simulation -> [tickRate, maxTicks, "
+                           "reportInterval, buildings, or autoUpgrade] in "
+                           "constants. Defaulting to 60, 36000, 3600, a "
+                           "spawner, and True", self.log, recoverable=True)
+            self.TICK_RATE: int = 60
+            self.MAX_TICKS: int = 36000
+            self.REPORT_INTERVAL: int = 3600
+            self.BUILDINGS: list[str] = ["warriorSpawner"]
+            self.AUTO_UPGRADE: bool = True
+
+    def __init__(self, CONSTANTS_FILE: str,
+                 maxTicks: int = None, tickRate: int = None) -> None:
+        """ Sets up the game and places the starting buildings.
+            maxTicks and tickRate override the values in constants """
+        super().__init__(CONSTANTS_FILE)
+
+        # Loading in the background would slow down the first ticks
+        Preloader.finish()
+
+        if maxTicks is not None:
+            self.MAX_TICKS = maxTicks
+        if tickRate is not None:
+            self.TICK_RATE = tickRate
+
+        # Every update simulates exactly one tick
+        self.window.setDeltaTime(1 / self.TICK_RATE)
+        self.ticks: int = 0
+
+        self.buildingsScene: BuildingsScene = \
+            self.sceneManager.getScene(SceneState.BUILDING)
+        self.dungeonScene: DungeonScene = \
+            self.sceneManager.getScene(SceneState.DUNGEON)
+
+        for buildingType in self.BUILDINGS:
+            self.placeNearPlayer(buildingType)
+
+    def createDatabase(self) -> Database:
+        """ Uses a database in memory so highscores aren't saved """
+        return Database(":memory:")
+
+    def placeNearPlayer(self, buildingType: str) -> None:
+        """ Places a building on the closest free tiles to the player """
+        tileset: Tileset = self.buildingsScene.getTileset()
+        start: Vect = (tileset.getPlayerStart() / Tileset.TILE_SIZE).floor()
+        mapSize: Vect = tileset.getTileSize()
+
+        # Search square rings of tiles outwards from the player
+        for ring in range(max(mapSize.x, mapSize.y)):
+            for y in range(start.y - ring, start.y + ring + 1):
+                for x in range(start.x - ring, start.x + ring + 1):
+                    onRing = max(abs(x - start.x), abs(y - start.y)) == ring
+                    if onRing and self.buildingsScene.buildAt(buildingType,
+                                                              Vect(x, y)):
+                        return
+
+        self.log.warning(f"No room to place {buildingType}")
+
+    def run(self) -> None:
+        """ Runs ticks until the max ticks is reached
+            or the player loses, reporting periodically """
+        self.log.info(f"Simulating {self.MAX_TICKS} ticks "
+                      f"at {self.TICK_RATE} ticks per second")
+        startTime: float = perf_counter()
+
+        while self.ticks < self.MAX_TICKS:
+            self.tick()
+
+            if ErrorUI.errored and not ErrorUI.isRecoverable():
+                self.log.error("Stopping simulation after an error")
+                break
+
+            if self.dungeonScene.hasLost():
+                self.log.info("All allies died")
+                break
+
+            if self.ticks % self.REPORT_INTERVAL == 0:
+                self.report(perf_counter() - startTime)
+
+        # Final report, unless one was just made
+        if self.ticks % self.REPORT_INTERVAL != 0:
+            self.report(perf_counter() - startTime)
+
+        self.database.saveAndClose()
+
+    def tick(self) -> None:
+        """ Updates both scenes by one tick, without any sounds """
+        self.buildingsScene.update(self.window, 0, 0)
+        self.dungeonScene.update(self.window, 0, 0)
+
+        # Upgrade once per simulated second
+        if self.AUTO_UPGRADE and self.ticks % self.TICK_RATE == 0:
+            self.upgradeBuildings()
+
+        self.ticks += 1
+
+    def upgradeBuildings(self) -> None:
+        """ Upgrades every building that the player can afford to """
+        for building in self.buildingsScene.getBuildings():
+            if building.reachedMaxLevel():
+                continue
+
+            cost = building.getUpgradeCost()
+            if Player.resources >= cost:
+                Player.resources -= cost
+                building.loadLevel()
+
+    def report(self, elapsed: float) -> None:
+        """ Logs the simulation speed and the state of the game """
+        ticksPerSec: float = self.ticks / elapsed if elapsed > 0 else 0
+        simTime: float = self.ticks / self.TICK_RATE
+
+        particles: int = (self.buildingsScene.getParticleCount() +
+                          self.dungeonScene.getParticleCount())
+
+        self.log.info(
+            f"{self.ticks} ticks ({round(simTime, 1)}s simulated) in "
+            f"{round(elapsed, 2)}s: {round(ticksPerSec, 1)} ticks/s | "
+            f"wave {self.dungeonScene.getWaveNum() + 1}, "
+            f"{self.dungeonScene.getEnemiesLeft()} enemies left | "
+            f"{self.dungeonScene.getAllyCount()} allies, "
+            f"{self.dungeonScene.getEnemyCount()} enemies, "
+            f"{self.dungeonScene.getProjectileCount()} projectiles, "
+            f"{particles} particles, "
+            f"{len(self.buildingsScene.getBuildings())} buildings"
+        )
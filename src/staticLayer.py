@@ -0,0 +1,144 @@
+import logging
+import pygame
+
+from src.utility.image import Image
+from src.utility.vector import Vect
+from src.window import Window
+from src.tileset import Tileset
+from src.entities.buildings.baseBuilding import BaseBuilding
+from src.ui.interfaces.errorUI import ErrorUI
+
+
+class StaticLayer:
+    """ Caches the tileset and the idle buildings on it into one image
+        covering the area around the view, so they can be rendered with
+        a single render. Only the areas of buildings that changed
+        (placed, sold, selected, or a new animation frame) are redrawn """
+    log = logging.getLogger(__name__)
+
+    @classmethod
+    def loadStatic(cls, constants: dict) -> None:
+        """ Loads the padding around the view from constants """
+        try:
+            # Extra area cached on every side of the view, so the layer
+            # only has to be redrawn after the camera moves this far
+            cls.PADDING: Vect = (Tileset.TILE_SIZE *
+                                 constants["tileset"]["layerPadding"])
+        except KeyError:
+            ErrorUI.create("Unable to find tileset -> layerPadding in "
+                           "constants. Defaulting to 4 tiles",
+                           cls.log, recoverable=True)
+            cls.PADDING: Vect = Tileset.TILE_SIZE * 4
+
+    def __init__(self, tileset: Tileset) -> None:
+        """ Creates an empty layer for the tileset """
+        self.tileset: Tileset = tileset
+
+        self.image: Image = None
+        # Area of the map the image covers
+        self.area: pygame.Rect = pygame.Rect(0, 0, 0, 0)
+
+        # State and area of each building, used to find which changed.
+        # Key: building, value: (state, rect on the map)
+        self.buildingStates: dict[BaseBuilding, tuple] = {}
+
+        # Areas of the map that need to be redrawn
+        self.dirty: list[pygame.Rect] = []
+
+        # Increased every time the image changes
+        self.version: int = 0
+
+    def update(self, surface: Window | Image, camOffset: Vect,
+               buildings: list[BaseBuilding]) -> None:
+        """ Moves the layer if the view has left it, and redraws the
+            areas of buildings that changed since the last update """
+        view: pygame.Rect = Vect.toRect(camOffset.floor(), surface.getSize())
+
+        if (self.image is None or not self.area.contains(view) or
+                self.image.getSize() != surface.getSize() + self.PADDING * 2):
+            self.moveTo(view)
+
+        self.updateBuildingStates(buildings)
+
+        if len(self.dirty) > 0:
+            self.redraw(buildings)
+
+    def moveTo(self, view: pygame.Rect) -> None:
+        """ Centers the layer on the view, redrawing all of it """
+        size: Vect = Vect(view.size) + self.PADDING * 2
+
+        if self.image is None or self.image.getSize() != size:
+            self.image = Image.makeEmpty(size)
+
+        self.area = Vect.toRect(Vect(view.topleft) - self.PADDING, size)
+        self.dirty = [self.area.copy()]
+
+    def updateBuildingStates(self, buildings: list[BaseBuilding]) -> None:
+        """ Marks the areas of buildings that were added, removed,
+            or changed how they look as dirty """
+        states: dict[BaseBuilding, tuple] = {}
+
+        for building in buildings:
+            anim = building.getAnim()
+            renderPos: Vect = building.getRenderPos()
+
+            state: tuple = (building.isIdle(), renderPos.toTuple(),
+                            anim.getCurrentFrame(),
+                            anim.getSpritesheet().getSurf())
+            rect: pygame.Rect = Vect.toRect(renderPos.floor(), anim.getSize())
+
+            states[building] = (state, rect)
+
+            if self.buildingStates.get(building) != (state, rect):
+                self.dirty.append(rect)
+
+                # Also clear where it used to be
+                if building in self.buildingStates:
+                    self.dirty.append(self.buildingStates[building][1])
+
+        # Buildings that were removed
+        for building in self.buildingStates.keys() - states.keys():
+            self.dirty.append(self.buildingStates[building][1])
+
+        self.buildingStates = states
+
+    def redraw(self, buildings: list[BaseBuilding]) -> None:
+        """ Redraws the tileset and idle buildings in the dirty areas """
+        surf: pygame.Surface = self.image.getSurf()
+        offset: Vect = -Vect(self.area.topleft)
+
+        for rect in self.dirty:
+            rect = rect.clip(self.area)
+            if rect.width == 0 or rect.height == 0:
+                continue
+
+            # Only draw inside the dirty area
+            surf.set_clip(rect.move(offset.toTuple()))
+            self.image.fill(0, 0, 0)
+
+            self.tileset.render(self.image, offset)
+
+            # In the same order as they're updated in
+            for building in buildings:
+                if (building.isIdle() and
+                        rect.colliderect(self.buildingStates[building][1])):
+                    building.render(self.image, offset)
+
+        surf.set_clip(None)
+        self.dirty.clear()
+        self.version += 1
+
+    def render(self, surface: Window | Image, offset: Vect) -> None:
+        """ Renders the layer, with the offset of the camera """
+        # Rounded down like the positions of everything drawn in it, as
+        # the layer's position is negative so rendering would round it up
+        pos: Vect = Vect(self.area.topleft) + offset.floor()
+
+        # The layer only changes on the window when the camera
+        # moves or the layer is redrawn
+        if isinstance(surface, Window):
+            surface.startStatic((id(self), pos.toTuple(), self.version))
+            surface.render(self.image, pos)
+            surface.endStatic()
+        else:
+            surface.render(self.image, pos)
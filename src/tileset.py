@@ -1,5 +1,6 @@
 import logging
 import os
+import pygame
 
 import src.utility.utility as util
 from src.utility.vector import Vect
@@ -47,11 +48,35 @@ class Tileset:
             ErrorUI.create("Unable to find tileset -> tilesFile in constants",
                            cls.log)
 
+        try:
+            # Width and height of each chunk of the map, in tiles
+            cls.CHUNK_TILES: int = constants["tileset"]["chunkTiles"]
+            # Chunks further than this many chunks from the view are evicted
+            cls.CHUNK_KEEP_DISTANCE: int = \
+                constants["tileset"]["chunkKeepDistance"]
+        except KeyError:
+            ErrorUI.create("Unable to find tileset -> [chunkTiles or "
+                           "chunkKeepDistance] in constants. Defaulting to "
+                           "16 and 1", cls.log, recoverable=True)
+            cls.CHUNK_TILES: int = 16
+            cls.CHUNK_KEEP_DISTANCE: int = 1
+
+        # Size of each chunk in pixels
+        cls.CHUNK_SIZE: Vect = cls.TILE_SIZE * cls.CHUNK_TILES
+
     def __init__(self, mapFolderName: str) -> None:
         """ Load tileset information and tiles """
 
-        # Entire map/tileset image
-        self.tiles: Image = None
+        # Rows of tile chars from the map file
+        self.mapRows: list[str] = []
+
+        # Images of the parts of the map that have been seen recently,
+        # built when they first come into view.
+        # Key: chunk coords, value: chunk image
+        self.chunks: dict[tuple[int, int], Image] = {}
+
+        # Key: tile char, value: scaled tile image
+        self.tileImages: dict[str, Image] = {}
 
         # 2D array for occupied tiles (for things like placing buildings)
         self.occupiedTiles: list[list[bool]] = []
@@ -76,35 +101,85 @@ class Tileset:
             self.playerStart = Vect(0, 0)
 
     def generateMapImg(self, mapPath: str) -> None:
-        """ Generates the tiles based on the chars in the map data """
+        """ Loads the chars in the map data. The tiles are
+            only drawn when their chunk is first rendered """
 
         mapData: str = util.loadFile(mapPath)
-        splitData: list[str] = mapData.split("\n")
+        self.mapRows = mapData.split("\n")
 
-        self.size: Vect = Vect(len(splitData[0]), len(splitData))
+        self.size: Vect = Vect(len(self.mapRows[0]), len(self.mapRows))
 
-        surfSize = Vect(len(splitData[0]) * self.TILE_SIZE.x,
-                        len(splitData) * self.TILE_SIZE.y)
+        # Add a row of False to occupiedTiles for every row of tiles
+        for row in self.mapRows:
+            self.occupiedTiles.append([False] * len(row))
 
-        # Create empty tileset image based on the tiledata
-        self.tiles = Image.makeEmpty(surfSize, scale=True)
+    def getTileImage(self, tileChar: str) -> Image:
+        """ Returns the scaled image for a tile char,
+            loading it if it hasn't been used before """
+        if tileChar not in self.tileImages:
+            self.tileImages[tileChar] = Image(self.TILESET_DATA[tileChar])
 
-        # Create Tile objects for every char in the map data
-        for y, row in enumerate(splitData):  # Rows
-            # Add a row of False to occupiedTiles
-            self.occupiedTiles.append([False] * len(row))
+        return self.tileImages[tileChar]
+
+    def generateChunk(self, chunkPos: Vect) -> Image:
+        """ Draws the tiles of a chunk onto a new image,
+            which is cut short at the edges of the map """
+        start: Vect = chunkPos * self.CHUNK_TILES
+        end: Vect = Vect(min(start.x + self.CHUNK_TILES, self.size.x),
+                         min(start.y + self.CHUNK_TILES, self.size.y))
+
+        # The size is already in scaled pixels
+        chunk = Image.makeEmpty((end - start) * self.TILE_SIZE)
 
-            for x, tileChar in enumerate(row):  # Columns
-                # Gets position of the tile in pixels
-                pos: Vect = Vect(x, y) * self.TILE_SIZE
+        for y in range(start.y, end.y):  # Rows
+            row: str = self.mapRows[y]
 
-                # Load image and draw to tiles image at the current pos
-                tileImg = Image(self.TILESET_DATA[tileChar])
-                self.tiles.render(tileImg, pos)
+            for x in range(start.x, min(end.x, len(row))):  # Columns
+                # Gets position of the tile in pixels within the chunk
+                pos: Vect = (Vect(x, y) - start) * self.TILE_SIZE
+                chunk.render(self.getTileImage(row[x]), pos)
+
+        return chunk
 
     def render(self, surface: Window | Image, offset: Vect = Vect()) -> None:
-        """ Renders tileset image """
-        surface.render(self.tiles, offset)
+        """ Renders the chunks of the map that are on the surface,
+            building new ones and evicting those that are far away """
+        view: pygame.Rect = Vect.toRect(-offset, surface.getSize())
+
+        # The tileset only changes on the window when the camera moves
+        if isinstance(surface, Window):
+            surface.startStatic((id(self), offset.toTuple()))
+
+        # Range of chunks that intersect the view, inside the map
+        first = Vect(max(view.left // self.CHUNK_SIZE.x, 0),
+                     max(view.top // self.CHUNK_SIZE.y, 0))
+        last = Vect(min((view.right - 1) // self.CHUNK_SIZE.x,
+                        (self.size.x - 1) // self.CHUNK_TILES),
+                    min((view.bottom - 1) // self.CHUNK_SIZE.y,
+                        (self.size.y - 1) // self.CHUNK_TILES))
+
+        for y in range(first.y, last.y + 1):
+            for x in range(first.x, last.x + 1):
+                if (x, y) not in self.chunks:
+                    self.chunks[(x, y)] = self.generateChunk(Vect(x, y))
+
+                pos: Vect = Vect(x, y) * self.CHUNK_SIZE + offset
+                surface.render(self.chunks[(x, y)], pos)
+
+        if isinstance(surface, Window):
+            surface.endStatic()
+
+        self.evictChunks(first, last)
+
+    def evictChunks(self, first: Vect, last: Vect) -> None:
+        """ Removes chunks that are further than the keep distance
+            from the range of chunks in view """
+        keep: int = self.CHUNK_KEEP_DISTANCE
+
+        for x, y in list(self.chunks):
+            if (x < first.x - keep or x > last.x + keep or
+                    y < first.y - keep or y > last.y + keep):
+                del self.chunks[(x, y)]
 
     def testRangeOccupied(self, startTile: Vect, tileRange: Vect) -> bool:
         """ Tests if a range of tiles has at least one tile occupied """
@@ -133,6 +208,7 @@ class Tileset:
     def getTileSize(self) -> Vect: return self.size
     def getSize(self) -> Vect: return self.size * self.TILE_SIZE
     def getData(self) -> dict: return self.data
+    def getChunkCount(self) -> int: return len(self.chunks)
 
     # Setters
     def setOccupied(self, tilePos: Vect, state: bool = True) -> None:
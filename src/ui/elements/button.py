@@ -23,6 +23,10 @@ class Button(BaseUIElement):
         for key, buttonPath in buttonData["images"].items():
             self.buttons[key] = super().transform(Image(buttonPath))
 
+        # Grayed out copies of the button images, shown when disabled.
+        # Made the first time the button is disabled
+        self.grayedButtons: dict[str, Image] = {}
+
         super().setImg(self.buttons["inactive"])
 
         self.text: Text = None
@@ -104,15 +108,10 @@ class Button(BaseUIElement):
         if super().isHidden():
             return
 
-        if self.mode in self.buttons:
-            btnImg = self.buttons[self.mode]
+        if self.enabled:
+            btnImg = self.getModeImg()
         else:
-            btnImg = self.buttons["inactive"]
-
-        if not self.enabled:
-            grayedImg = btnImg.copy()  # Copy image
-            grayedImg.tint(140, 140, 140)  # Make gray
-            btnImg = grayedImg  # Set to grayed image
+            btnImg = self.getModeImg(self.grayedButtons)
 
         super().render(surface, image=btnImg, offset=offset)
 
@@ -131,12 +130,23 @@ class Button(BaseUIElement):
 
     def getText(self) -> Text: return self.text
 
-    def getModeImg(self) -> Image:
-        """ Gets the mode image or defaults to the inactive img """
-        if self.mode in self.buttons:
-            return self.buttons[self.mode]
+    def getModeImg(self, buttons: dict[str, Image] = None) -> Image:
+        """ Gets the mode image or defaults to the inactive img,
+            from the given button images or the normal ones """
+        if buttons is None:
+            buttons = self.buttons
 
-        return self.buttons["inactive"]
+        if self.mode in buttons:
+            return buttons[self.mode]
+
+        return buttons["inactive"]
+
+    def makeGrayedButtons(self) -> None:
+        """ Makes grayed out copies of the button images """
+        for key, image in self.buttons.items():
+            grayedImg = image.copy()  # Copy image
+            grayedImg.tint(140, 140, 140)  # Make gray
+            self.grayedButtons[key] = grayedImg
 
     # Setters
     def setMode(self, mode: str) -> None:
@@ -152,3 +162,6 @@ class Button(BaseUIElement):
 
         if not enabled:  # Set image to inactive
             self.setMode("inactive")
+
+            if len(self.grayedButtons) == 0:
+                self.makeGrayedButtons()
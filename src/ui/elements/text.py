@@ -1,8 +1,11 @@
 import pygame
 import logging
+from collections import OrderedDict
 
 from src.ui.elements.baseUIElement import BaseUIElement
 from src.utility.image import Image
+from src.utility.vector import Vect
+from src.window import Window
 
 
 class Text(BaseUIElement):
@@ -13,6 +16,11 @@ class Text(BaseUIElement):
     # Key: font size, value: pygame.font.Font object
     fonts: dict[int, pygame.font.Font] = {}
 
+    # Static variable of rendered text shared by all texts, with
+    # the least recently used removed first once it's over the max size.
+    # Key: (text, font size, color, wrap length), value: text surface
+    renderedText: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
     @classmethod
     def loadStatic(cls, constants: dict) -> None:
         try:
@@ -23,6 +31,15 @@ class Text(BaseUIElement):
             ErrorUI.create("Unable to find game -> font in constants",
                            cls.log)
 
+        try:
+            cls.TEXT_CACHE_SIZE: int = constants["game"]["textCacheSize"]
+        except KeyError:
+            from src.ui.interfaces.errorUI import ErrorUI
+            ErrorUI.create("Unable to find game -> textCacheSize in "
+                           "constants. Defaulting to 256",
+                           cls.log, recoverable=True)
+            cls.TEXT_CACHE_SIZE: int = 256
+
     def __init__(self, textData: dict) -> None:
         """ Loads text data and initializes """
         super().__init__(textData)
@@ -57,16 +74,57 @@ class Text(BaseUIElement):
         """ Uses the text and font to draw an image,
             and then sets the image of the BaseUIElement to it. """
 
-        font: pygame.font.Font = self.getFontObj(self.fontSize)
+        image: pygame.Surface = self.renderText()
 
-        # Draw image with text
-        image: pygame.Surface = font.render(self.text, False, self.color,
-                                            wraplength=self.wrapLength)
-
-        # Create, transform, and set surf with text
+        # Create, transform, and set surf with text.
+        # The surface is shared with other texts through the cache
         surf: Image = Image(surf=image, scale=False)
+        surf.setShared(True)
         super().setImg(super().transform(surf))
 
+        # Laid out by the size it covers on the canvas
+        super().setSize(surf.getSize() // Image.RENDER_SCALE)
+
+    def render(self, surface: Window | Image,
+               image: Image = None, offset: Vect = Vect()) -> None:
+        """ Renders the text to the given window or surf, which draws
+            it at the window's resolution when rendering natively """
+        if super().isHidden():
+            return
+
+        image = image if image is not None else self.image
+
+        surface.renderText(image, self.renderPos + offset)
+
+    def renderText(self) -> pygame.Surface:
+        """ Returns the text drawn with the font, only drawing
+            it if the same text isn't already cached """
+        key = (self.text, self.fontSize, tuple(self.color), self.wrapLength)
+
+        if key in self.renderedText:
+            self.renderedText.move_to_end(key)  # Most recently used
+            return self.renderedText[key]
+
+        # When rendering at native resolution, the font is unreadable
+        # at its native size, so it's drawn as large as it's shown on
+        # the window, and drawn onto it after the canvas is scaled up
+        renderScale: int = Image.RENDER_SCALE
+        font: pygame.font.Font = self.getFontObj(self.fontSize * renderScale)
+
+        # Draw image with text
+        image: pygame.Surface = font.render(
+            self.text, False, self.color,
+            wraplength=self.wrapLength * renderScale
+        )
+
+        self.renderedText[key] = image
+
+        # Remove the least recently used text
+        if len(self.renderedText) > self.TEXT_CACHE_SIZE:
+            self.renderedText.popitem(last=False)
+
+        return image
+
     # Setters
     def setText(self, newText: str) -> None:
         """ Sets the text and generates a new text image """
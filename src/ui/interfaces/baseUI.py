@@ -49,6 +49,9 @@ class BaseUI:
         self.data = self.loadJson(jsonFile)
         self.name = jsonFile
 
+        # Position of the UI on the window, found every update
+        self.offset: Vect = Vect()
+
         # Dict storing all UI element objects
         # Key: string ID provided in the JSON
         # Value: UI element object (inherited from BaseUIElement)
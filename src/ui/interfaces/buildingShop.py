@@ -126,7 +126,7 @@ class BuildingShop(BaseUI):
         """ Renders detail UIs to a clipped surface
             and then renders that to the given surface """
         offset: Vect = super().getOffset()
-        self.clipSurface.getSurf().fill((0, 0, 0, 0))  # Clear surf
+        self.clipSurface.clear()  # Clear surf and its text
 
         for ui in self.detailUIs:
             # Render at the negative offset to clip it
@@ -5,6 +5,7 @@ from src.utility.database import Database
 import src.utility.utility as util
 from src.ui.interfaces.tutorial import Tutorial
 from src.utility.image import Image
+from src.utility.preloader import Preloader
 from src.utility.vector import Vect
 
 
@@ -22,6 +23,9 @@ class MainMenu(BaseUI):
 
         self.tutorial: Tutorial = Tutorial()
 
+        # Number of assets loaded when the loading text was last updated
+        self.loadedCount: int = -1
+
     def setupDatabase(self) -> None:
         """ Sets up the settings database table """
         self.db.makeTable("settings", "type TEXT, value INTEGER")
@@ -42,6 +46,7 @@ class MainMenu(BaseUI):
     def update(self, window: Window) -> None:
         """ Updates the menu and the scene behind it """
         super().update(window)
+        self.updateLoading()
 
         if self.tutorial.isHidden():
             # Updating the main menu buttons
@@ -51,6 +56,23 @@ class MainMenu(BaseUI):
 
         self.tutorial.update(window)
 
+    def updateLoading(self) -> None:
+        """ Adds the assets the preloader has loaded, showing its
+            progress and only enabling play once everything is loaded """
+        Preloader.update()
+
+        # Only changes the elements when more assets have been loaded
+        if Preloader.getLoadedCount() == self.loadedCount:
+            return
+        self.loadedCount = Preloader.getLoadedCount()
+
+        loaded: bool = Preloader.isFinished()
+        super().getElement("play").setEnabled(loaded)
+
+        loading = super().getElement("loading")
+        loading.setHidden(loaded)
+        loading.setText(f"Loading {round(Preloader.getProgress() * 100)}%")
+
     def checkPlayButton(self, window: Window) -> None:
         """ Checks if the play button is pressed """
         if super().getElement("play").getActivated():
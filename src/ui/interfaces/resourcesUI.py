@@ -15,12 +15,14 @@ class ResourcesUI(BaseUI):
     def __init__(self) -> None:
         super().__init__("resourcesUI")
 
-    def update(self, window: Window, waveNum: int) -> None:
-        """ Updates the UI, resources shown, and the wave number """
+    def update(self, window: Window, waveNum: int, enemiesLeft: int) -> None:
+        """ Updates the UI, resources shown, the wave number,
+            and the number of enemies left in the wave """
         super().update(window)
 
         self.updateResources()
         self.updateWaveNum(waveNum)
+        self.updateEnemiesLeft(enemiesLeft)
 
     def updateResources(self) -> None:
         """ Update all the resources
@@ -44,3 +46,7 @@ class ResourcesUI(BaseUI):
     def updateWaveNum(self, waveNum: int) -> None:
         """ Sets the wave number displayed """
         super().getElement("waveText").setText(f"Wave {waveNum + 1}")
+
+    def updateEnemiesLeft(self, enemiesLeft: int) -> None:
+        """ Sets the number of enemies left displayed """
+        super().getElement("enemiesText").setText(f"{enemiesLeft} left")
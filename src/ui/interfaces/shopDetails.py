@@ -39,8 +39,9 @@ class ShopDetails(BaseUI):
         self.log.info(f"Loading shop details for building {self.type}")
         super().getElement("buildingName").setText(data["name"])
 
-        # Get building anim and use the first frame of its animation
-        buildingImg: Image = Entity.loadAnim(data["anim"]).getFrame(0)
+        # Get building anim and use a copy of the first frame of its
+        # animation, as the frame is shared with the building's animations
+        buildingImg: Image = Entity.loadAnim(data["anim"]).getFrame(0).copy()
 
         # Find the percentage to scale the building image by
         scale = self.buildingScaledHeight / buildingImg.getSize().y
@@ -1,5 +1,6 @@
 import pygame
 import logging
+from collections import OrderedDict
 
 from src.window import Window
 from src.utility.vector import Vect
@@ -13,6 +14,29 @@ class Animation:
         Only works with horizontal spritesheets """
     log = logging.getLogger(__name__)
 
+    # Static variable of tinted frames shared by all animations, with
+    # the least recently used removed first once it's over the max size.
+    # Key: (frames key, frame, tint, blend mode, alpha), value: tinted frame
+    tintedFrames: OrderedDict[tuple, Image] = OrderedDict()
+
+    # Static variable of the frames of each spritesheet, sliced once and
+    # shared by all animations using the same (cached) spritesheet.
+    # Key: (spritesheet key, frame count), value: (frame images, frame rects)
+    slicedFrames: dict[tuple, tuple[list[Image], list[pygame.Rect]]] = {}
+
+    @classmethod
+    def loadStatic(cls, constants: dict) -> None:
+        """ Loads the max size of the tinted frame cache """
+        try:
+            cls.TINT_CACHE_SIZE: int = constants["game"]["tintCacheSize"]
+        except KeyError:
+            # avoid circular import
+            from src.ui.interfaces.errorUI import ErrorUI
+            ErrorUI.create("Unable to find game -> tintCacheSize in "
+                           "constants. Defaulting to 256",
+                           cls.log, recoverable=True)
+            cls.TINT_CACHE_SIZE: int = 256
+
     def __init__(self, path: str, frameCount: int, delay: float,
                  oneTime: bool = False) -> None:
         """ Sets initial values for the animation """
@@ -28,8 +52,43 @@ class Animation:
         self.frameCount = frameCount
         self.currentFrame: int = 0
 
+        # Image and area on the spritesheet of every frame
+        self.frames, self.frameRects = self.sliceFrames()
+
         self.oneTime: bool = oneTime
 
+    def sliceFrames(self) -> tuple[list[Image], list[pygame.Rect]]:
+        """ Returns the images and areas of the frames on the spritesheet,
+            reusing those of another animation with the same spritesheet """
+        key: tuple = self.getFramesKey()
+        if key is not None:
+            if key in self.slicedFrames:
+                return self.slicedFrames[key]
+
+        rects: list[pygame.Rect] = [
+            pygame.Rect(frame * self.frameSize.x, 0,
+                        self.frameSize.x, self.frameSize.y)
+            for frame in range(self.frameCount)
+        ]
+        frames: list[Image] = [
+            self.spritesheet.getSection(Vect(rect.topleft), self.frameSize)
+            for rect in rects
+        ]
+
+        if key is not None:
+            self.slicedFrames[key] = (frames, rects)
+
+        return frames, rects
+
+    def getFramesKey(self) -> tuple:
+        """ Returns the key of the frames sliced from the spritesheet,
+            or None if the spritesheet isn't cached so has no key """
+        key: tuple = self.spritesheet.getKey()
+        if key is None:
+            return None
+
+        return key, self.frameCount
+
     def update(self, window: Window) -> None:
         """ Updates animation timer and frame if necessary """
         if self.oneTime and self.currentFrame >= self.frameCount:
@@ -51,26 +110,85 @@ class Animation:
     def render(self, surface: Window | Image, pos: Vect) -> None:
         """ Renders the portion of the animation spritesheet
             that's the current frame to the window """
+        self.renderFrame(surface, pos, self.currentFrame)
+
+    def renderFrame(self, surface: Window | Image, pos: Vect,
+                    frame: int) -> None:
+        """ Renders the given frame of the spritesheet """
+        # A finished one time animation has no frame to render
+        if frame >= self.frameCount:
+            return
 
-        # Gets the coordinates and size of the current frame of the spritesheet
-        area = pygame.Rect(self.currentFrame * self.frameSize.x, 0,
-                           self.frameSize.x, self.frameSize.y)
+        surface.render(self.spritesheet, pos, area=self.frameRects[frame])
 
-        surface.render(self.spritesheet, pos, area=area)
+    def getFrameAt(self, time: float) -> int:
+        """ Returns the frame that a looping animation would be on
+            after the given amount of time since it started """
+        return int(time // self.timer.delay) % self.frameCount
+
+    def getTime(self) -> float:
+        """ Returns the time a looping animation has been
+            on its current loop, from its frame and timer """
+        return self.currentFrame * self.timer.delay + self.timer.timer
+
+    def setTime(self, time: float) -> None:
+        """ Sets the frame and timer to where a looping animation
+            would be after the given amount of time since it started """
+        self.currentFrame = self.getFrameAt(time)
+        self.timer.timer = time % self.timer.delay
 
     # Getters
     def getSize(self) -> Vect: return self.frameSize
+    def getCurrentFrame(self) -> int: return self.currentFrame
+    def getFrameCount(self) -> int: return self.frameCount
+    def getSpritesheet(self) -> Image: return self.spritesheet
+
+    def getFrameRect(self, frame: int) -> pygame.Rect:
+        """ Returns the area of the frame on the spritesheet.
+            The rect is shared, so it shouldn't be changed """
+        return self.frameRects[frame]
 
     def getFrame(self, frame: int = None) -> Image:
-        """ Returns the given frame of the spritesheet """
+        """ Returns the given frame of the spritesheet. The image is
+            shared, so it should be copied before it's changed """
         if frame is None:
             frame = self.currentFrame
 
-        # Position of the frame on the spritesheet
-        pos: Vect = Vect(frame * self.frameSize.x, 0)
+        return self.frames[frame]
+
+    def getTintedFrame(self, tint: tuple[int] = None,
+                       blendMode: int = pygame.BLEND_MULT,
+                       alpha: int = None) -> Image:
+        """ Returns the current frame with the tint and alpha applied,
+            only creating the tinted image if it isn't already cached """
+        if tint is not None:
+            tint = tuple(tint)  # Lists from JSON can't be keys
+
+        # Frames from a spritesheet that isn't cached aren't shared,
+        # so their tinted frames aren't cached either
+        framesKey: tuple = self.getFramesKey()
+        key = (framesKey, self.currentFrame, tint, blendMode, alpha)
+
+        if framesKey is not None and key in self.tintedFrames:
+            self.tintedFrames.move_to_end(key)  # Most recently used
+            return self.tintedFrames[key]
+
+        img: Image = self.getFrame().copy()
+        if alpha is not None:
+            img.setAlpha(alpha)
+        if tint is not None:
+            img.tint(*tint, blendMode=blendMode)
+
+        if framesKey is None:
+            return img
+
+        self.tintedFrames[key] = img
+
+        # Remove the least recently used tinted frame
+        if len(self.tintedFrames) > self.TINT_CACHE_SIZE:
+            self.tintedFrames.popitem(last=False)
 
-        # Get new image of only the frame
-        return self.spritesheet.getSection(pos, self.frameSize)
+        return img
 
     def isFinished(self) -> bool: return self.currentFrame >= self.frameCount
 
@@ -0,0 +1,124 @@
+import pygame
+import logging
+import os
+
+from src.utility.vector import Vect
+from src.utility.image import Image
+from src.ui.interfaces.errorUI import ErrorUI
+
+
+class Atlas:
+    """ Packs every image in the sprite folders, already scaled, into
+        a few large surfaces (pages) when the game starts. Image(path)
+        then returns a section of a page instead of its own surface """
+    log = logging.getLogger(__name__)
+
+    # Surfaces that the images are packed into
+    pages: list[pygame.Surface] = []
+
+    @classmethod
+    def loadStatic(cls, constants: dict) -> None:
+        """ Loads the atlas settings from constants """
+        try:
+            cls.ENABLED: bool = constants["atlas"]["enabled"]
+            # Folders searched (including subfolders) for images to pack
+            cls.FOLDERS: list[str] = constants["atlas"]["folders"]
+            # Max size of each page, in pixels
+            cls.PAGE_SIZE: Vect = Vect(constants["atlas"]["pageSize"])
+        except KeyError:
+            ErrorUI.create("Unable to find atlas -> [enabled, folders, or "
+                           "pageSize] in constants. Defaulting to False",
+                           cls.log, recoverable=True)
+            cls.ENABLED: bool = False
+            cls.FOLDERS: list[str] = []
+            cls.PAGE_SIZE: Vect = Vect(2048, 2048)
+
+    @classmethod
+    def build(cls) -> None:
+        """ Loads, scales, and packs the images into pages, adding the
+            sections of the pages to the image cache. Must be called
+            after the window is created """
+        if not cls.ENABLED:
+            return
+
+        images: list[tuple[str, pygame.Surface]] = []
+        for path in cls.findImages():
+            surf = pygame.image.load(path).convert_alpha()
+
+            if Image.SCALE != 1:
+                size: Vect = Vect(surf.get_size()) * Image.SCALE
+                surf = pygame.transform.scale(surf, size.toTuple())
+
+            if (surf.get_width() > cls.PAGE_SIZE.x or
+                    surf.get_height() > cls.PAGE_SIZE.y):
+                cls.log.warning(f"{path} is too large for the atlas")
+                continue
+
+            images.append((path, surf))
+
+        # Tallest first, so each row of images wastes little space
+        images.sort(key=lambda image: image[1].get_height(), reverse=True)
+
+        # Position and page of every image, and the height of every page
+        placements: list[tuple[int, Vect]] = []
+        pageHeights: list[int] = []
+
+        page: int = 0
+        pos: Vect = Vect(0, 0)
+        rowHeight: int = 0
+
+        for path, surf in images:
+            width, height = surf.get_size()
+
+            # Start a new row
+            if pos.x + width > cls.PAGE_SIZE.x:
+                pos = Vect(0, pos.y + rowHeight)
+                rowHeight = 0
+
+            # Start a new page
+            if pos.y + height > cls.PAGE_SIZE.y:
+                pageHeights.append(pos.y)
+                page += 1
+                pos = Vect(0, 0)
+                rowHeight = 0
+
+            placements.append((page, pos.copy()))
+            pos.x += width
+            rowHeight = max(rowHeight, height)
+
+        pageHeights.append(pos.y + rowHeight)
+
+        # Pages are only as tall as the images on them
+        cls.pages = [
+            pygame.Surface((cls.PAGE_SIZE.x, height),
+                           pygame.SRCALPHA).convert_alpha()
+            for height in pageHeights
+        ]
+
+        for (path, surf), (page, pos) in zip(images, placements):
+            # Adding onto the empty page copies the pixels exactly
+            cls.pages[page].blit(surf, pos.toTuple(),
+                                 special_flags=pygame.BLEND_RGBA_ADD)
+
+            section = cls.pages[page].subsurface(
+                Vect.toRect(pos, Vect(surf.get_size()))
+            )
+            Image.addScaled(path, section)
+
+        cls.log.info(f"Packed {len(images)} images into "
+                     f"{len(cls.pages)} atlas pages")
+
+    @classmethod
+    def findImages(cls) -> list[str]:
+        """ Returns the paths of all images in the atlas folders """
+        paths: list[str] = []
+
+        for folder in cls.FOLDERS:
+            for root, _, files in os.walk(folder):
+                for file in sorted(files):
+                    if file.endswith(".png"):
+                        # Paths in the data files use forward slashes
+                        path = os.path.join(root, file)
+                        paths.append(path.replace(os.sep, "/"))
+
+        return paths
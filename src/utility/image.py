@@ -7,13 +7,20 @@ from src.utility.vector import Vect
 
 class Image:
     """ Contains a single pygame.Surface object for images
-        Reduces loading the same image multiple times,
-        and contains easy functions for rendering and others """
+        Reduces loading and transforming the same image multiple times,
+        and contains easy functions for rendering and others.
+        Images loaded from a path share their surface, which is only
+        copied once the image is changed (copy on write) """
     log = logging.getLogger(__name__)
 
     # Static variable for all images to avoid duplicates
-    # Key: path, value: pygame.Surface (the image)
-    images: dict[str, pygame.Surface] = {}
+    # Key: (path, then each transform applied to it in order, such as
+    # ("scale", size), ("rotate", degrees) or ("flip", x, y)),
+    # value: pygame.Surface (the shared image)
+    images: dict[tuple, pygame.Surface] = {}
+    # Key: path, value: key of the image scaled by SCALE in images,
+    # so it can be found without loading the unscaled image
+    scaledKeys: dict[str, tuple] = {}
 
     @classmethod
     def loadStatic(cls, constants: dict) -> None:
@@ -28,6 +35,40 @@ class Image:
             )
             cls.SCALE = 3
 
+        try:
+            # Whether to render everything at its original size and scale
+            # the whole window up once per frame, instead of scaling
+            # every image up when it's loaded
+            nativeResolution: bool = constants["game"]["nativeResolution"]
+        except KeyError:
+            from src.ui.interfaces.errorUI import ErrorUI
+            ErrorUI.create("Missing game -> nativeResolution in constants. "
+                           "Defaulting to False", cls.log, recoverable=True)
+            nativeResolution: bool = False
+
+        # Scale the window is drawn at, which is 1 unless the images
+        # are left at their original size
+        cls.RENDER_SCALE = 1
+        if nativeResolution:
+            cls.RENDER_SCALE = cls.SCALE
+            cls.SCALE = 1
+
+    @classmethod
+    def addScaled(cls, path: str, surf: pygame.Surface) -> None:
+        """ Adds an image that's already been scaled by SCALE to the
+            cache, such as a section of the atlas """
+        key: tuple = (path,)
+        if cls.SCALE != 1:
+            key += (("scale", Vect(surf.get_size()).toTuple()),)
+            cls.scaledKeys[path] = key
+
+        cls.images[key] = surf
+
+    @classmethod
+    def isLoaded(cls, path: str) -> bool:
+        """ Returns True if the image at the path is already cached """
+        return path in cls.scaledKeys or (path,) in cls.images
+
     @staticmethod
     def makeEmpty(size: Vect, scale=False, transparent=False) -> Image:
         """ Creates an empty transparent surface with a given size """
@@ -49,13 +90,35 @@ class Image:
 
         self.image = surf
 
+        # Key of the surface in the images cache, or None if it isn't cached
+        self.key: tuple = None
+        # Whether the surface is used by other images,
+        # so it has to be copied before it's changed
+        self.shared: bool = False
+
+        # Text rendered to the image when rendering at native resolution,
+        # which is drawn at the window's resolution once the image is
+        # rendered to the window (see renderText). Each is (text image,
+        # position, area of the image the text is clipped to)
+        self.texts: list[tuple[Image, Vect, pygame.Rect]] = []
+
         if path is not None:
-            # Load image if it hasn't been loaded before
-            if path not in self.images:
-                self.images[path] = pygame.image.load(path).convert_alpha()
-                self.log.info(f"Loaded image {path}")
+            self.shared = True
 
-            self.image = self.images[path]
+            if scale and path in self.scaledKeys:
+                # Use the image that was already scaled
+                self.key = self.scaledKeys[path]
+                scale = False
+            else:
+                self.key = (path,)
+
+                # Load image if it hasn't been loaded before
+                if self.key not in self.images:
+                    self.images[self.key] = \
+                        pygame.image.load(path).convert_alpha()
+                    self.log.info(f"Loaded image {path}")
+
+            self.image = self.images[self.key]
 
         # Get size of image
         self.size: Vect = Vect(self.image.get_size())
@@ -64,17 +127,68 @@ class Image:
             # Scale image up by the scale factor
             self.transform(self.size * self.SCALE)
 
+            if path is not None:
+                self.scaledKeys[path] = self.key
+
     def render(self, other: Image, pos: Vect = Vect(),
                area: pygame.Rect = None) -> None:
         """ Renders another image to this image at a given pos """
-        self.image.blit(other.image, pos.toTuple(), area=area)
+        self.makeUnique()
+        rect: pygame.Rect = self.image.blit(other.image, pos.toTuple(),
+                                            area=area)
+
+        # Move the other image's text along with it
+        for text, textPos, clip in other.texts:
+            self.renderText(text, *Image.moveText(textPos, clip, pos,
+                                                  area, rect))
+
+    def renderText(self, text: Image, pos: Vect,
+                   clip: pygame.Rect = None) -> None:
+        """ Renders text to this image at a given pos. At native resolution,
+            the text is kept to be drawn when the image is rendered to the
+            window instead, only showing the area of it that's in the clip
+            rect (if given) and this image """
+        if self.RENDER_SCALE == 1:
+            self.render(text, pos)
+            return
+
+        bounds: pygame.Rect = Vect.toRect(Vect(0, 0), self.size)
+        if clip is not None:
+            bounds = bounds.clip(clip)
+
+        self.texts.append((text, pos, bounds))
+
+    @staticmethod
+    def moveText(textPos: Vect, clip: pygame.Rect, pos: Vect,
+                 area: pygame.Rect,
+                 rect: pygame.Rect) -> tuple[Vect, pygame.Rect]:
+        """ Returns the position and clip rect of text kept by an image
+            that's rendered at pos (with the given area of it) and covered
+            rect, so it's drawn where it was on the image """
+        if area is not None:
+            textPos = textPos - Vect(area.topleft)
+            clip = clip.move(-area.x, -area.y)
+
+        return textPos + pos, clip.move(pos.floor().toTuple()).clip(rect)
+
+    def clear(self) -> None:
+        """ Clears the image to transparent, along with its text """
+        self.fill((0, 0, 0, 0))
+        self.texts.clear()
+
+    def renderMany(self, blits: list[tuple]) -> None:
+        """ Renders a list of (pygame.Surface, position tuple, area) """
+        self.makeUnique()
+        self.image.blits(blits, doreturn=False)
 
     def fill(self, *color) -> None:
         """ Fills the image with a given color """
+        self.makeUnique()
         self.image.fill(color)
 
     def tint(self, *color, blendMode=pygame.BLEND_MULT) -> None:
         """ Tints the image with a given color """
+        self.makeUnique()
         self.image.fill(color, special_flags=blendMode)
 
     def copy(self) -> Image:
@@ -83,24 +197,56 @@ class Image:
 
     def setAlpha(self, alpha: int) -> None:
         """ Sets the alpha of the image """
+        self.makeUnique()
         self.image.set_alpha(alpha)
 
+    def makeUnique(self) -> None:
+        """ Copies the surface if it's shared, so that changing
+            it doesn't change any other images """
+        if self.shared:
+            self.image = self.image.copy()
+            self.shared = False
+
+        # The surface no longer matches its key once changed
+        self.key = None
+
+    def cachedTransform(self, key: tuple, function, *args) -> None:
+        """ Sets the surface to the result of function(surface, *args),
+            reusing the result from another image with the same key
+            in the images cache if the surface is cached """
+        if self.key is None:
+            self.image = function(self.image, *args)
+            self.shared = False
+            return
+
+        self.key += (key,)
+        if self.key not in self.images:
+            self.images[self.key] = function(self.image, *args)
+
+        self.image = self.images[self.key]
+        self.shared = True
+
     def transform(self, size: Vect) -> None:
         """ Transforms the image to the given size """
-        self.image = pygame.transform.scale(self.image, size.toTuple())
+        self.cachedTransform(("scale", size.toTuple()),
+                             pygame.transform.scale, size.toTuple())
         self.size = size
 
     def rotate(self, degrees: float) -> None:
         """ Rotates the image by the given degrees """
         if degrees != 0:
-            self.image = pygame.transform.rotate(self.image, degrees)
+            self.cachedTransform(("rotate", degrees),
+                                 pygame.transform.rotate, degrees)
 
     def flip(self, x: bool, y: bool) -> None:
         """ Flips the image on the x and/or y axis """
-        self.image = pygame.transform.flip(self.image, x, y)
+        if x or y:
+            self.cachedTransform(("flip", x, y),
+                                 pygame.transform.flip, x, y)
 
     def drawCircle(self, radius: int, color: tuple[int, int, int]) -> None:
         """ Draws a circle centered on the image """
+        self.makeUnique()
         pygame.draw.circle(self.image, color,
                            (self.size // 2).toTuple(), radius)
 
@@ -118,10 +264,21 @@ class Image:
         """ Returns a subsurface of the image """
         rect = pygame.Rect(pos.toTuple(), size.toTuple())  # Create rect
         subsurface = self.image.subsurface(rect)  # Get pygame.Surface subsurf
-        return Image(surf=subsurface, scale=False)  # Return as Image
+        section = Image(surf=subsurface, scale=False)  # Return as Image
+
+        # The section shares its pixels with this image's surface
+        section.shared = self.shared
+        return section
 
     # Getters
     def getSurf(self) -> pygame.Surface: return self.image
     def getSize(self) -> Vect: return self.size
     def getWidth(self) -> int: return self.size.x
     def getHeight(self) -> int: return self.size.y
+    def getKey(self) -> tuple: return self.key
+
+    # Setters
+    def setShared(self, shared: bool) -> None:
+        """ Sets whether the surface is used by other images,
+            so it's copied before it's changed """
+        self.shared = shared
@@ -23,12 +23,16 @@ class Overlay:
         if opacity < 0:
             opacity = self.maxOpacity
 
-        # Update overlay image if anything changed
-        if self.opacity != opacity or self.size != size:
-            self.opacity = opacity
+        # Only make a new overlay image if the size changed,
+        # since fading only changes the alpha it's drawn with
+        if self.size != size:
             self.size = size
             self.makeOverlay()
 
+        if self.opacity != opacity:
+            self.opacity = opacity
+            self.image.setAlpha(opacity)
+
     def makeOverlay(self) -> None:
         """ Creates the overlay image """
         self.image = Image.makeEmpty(self.size, scale=False,
@@ -44,5 +48,14 @@ class Overlay:
         return round(percent * self.maxOpacity)
 
     def render(self, surface: Window | Image) -> None:
-        """ Renders the overlay """
-        surface.render(self.image, Vect(0, 0))
+        """ Renders the overlay, which only changes
+            on the window when its opacity or size does """
+        if self.opacity == 0:
+            return  # Fully transparent
+
+        if isinstance(surface, Window):
+            surface.startStatic((id(self), self.opacity, self.size.toTuple()))
+            surface.render(self.image, Vect(0, 0))
+            surface.endStatic()
+        else:
+            surface.render(self.image, Vect(0, 0))
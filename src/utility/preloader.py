@@ -0,0 +1,198 @@
+import pygame
+import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import src.utility.utility as util
+from src.utility.vector import Vect
+from src.utility.image import Image
+from src.utility.sound import Sound
+from src.ui.interfaces.errorUI import ErrorUI
+
+
+class Preloader:
+    """ Finds every image and sound referenced in the data files (the
+        manifest), then loads them on a pool of threads while the main
+        menu is shown, so nothing is loaded from the disk during play """
+    log = logging.getLogger(__name__)
+
+    IMAGE_TYPES: tuple[str] = (".png",)
+    SOUND_TYPES: tuple[str] = (".wav", ".ogg", ".mp3")
+
+    # Assets being loaded that haven't been added to the caches yet.
+    # Key: path, value: future of the loaded surface or sound file contents
+    pending: dict[str, Future] = {}
+    # Number of assets being preloaded in total
+    total: int = 0
+
+    executor: ThreadPoolExecutor = None
+
+    @classmethod
+    def loadStatic(cls, constants: dict) -> None:
+        """ Loads the preloader settings from constants """
+        try:
+            cls.ENABLED: bool = constants["preloader"]["enabled"]
+            # Data files, or folders of data files, searched for assets
+            cls.SOURCES: list[str] = constants["preloader"]["sources"]
+            # Number of threads loading assets at once
+            cls.THREADS: int = constants["preloader"]["threads"]
+        except KeyError:
+            ErrorUI.create("Unable to find preloader -> [enabled, sources, "
+                           "or threads] in constants. Defaulting to False",
+                           cls.log, recoverable=True)
+            cls.ENABLED: bool = False
+            cls.SOURCES: list[str] = []
+            cls.THREADS: int = 4
+
+    @classmethod
+    def start(cls) -> None:
+        """ Starts loading the assets in the manifest that haven't been
+            loaded yet. Must be called after the window is created """
+        if not cls.ENABLED:
+            return
+
+        paths: list[str] = [path for path in cls.buildManifest()
+                            if not cls.isLoaded(path)]
+
+        cls.executor = ThreadPoolExecutor(max_workers=cls.THREADS,
+                                          thread_name_prefix="preloader")
+        for path in paths:
+            cls.pending[path] = cls.executor.submit(cls.load, path)
+
+        cls.total = len(paths)
+        cls.log.info(f"Preloading {cls.total} assets")
+
+    @classmethod
+    def buildManifest(cls) -> list[str]:
+        """ Returns the paths of every asset in the data files """
+        paths: set[str] = set()
+
+        for source in cls.SOURCES:
+            for file in cls.findDataFiles(source):
+                cls.findAssets(util.loadJSON(file), paths)
+
+        return sorted(paths)
+
+    @classmethod
+    def findDataFiles(cls, source: str) -> list[str]:
+        """ Returns the source if it's a file, or the
+            paths of the JSON files in it if it's a folder """
+        if not os.path.isdir(source):
+            return [source]
+
+        files: list[str] = []
+        for root, _, names in os.walk(source):
+            for name in sorted(names):
+                if name.endswith(".json"):
+                    files.append(os.path.join(root, name))
+
+        return files
+
+    @classmethod
+    def findAssets(cls, data, paths: set[str]) -> None:
+        """ Adds the asset paths in the JSON data to paths """
+        if isinstance(data, dict):
+            data = list(data.values())
+
+        if isinstance(data, list):
+            for value in data:
+                cls.findAssets(value, paths)
+
+        elif (isinstance(data, str) and
+                data.endswith(cls.IMAGE_TYPES + cls.SOUND_TYPES)):
+            if os.path.isfile(data):
+                paths.add(data)
+            else:
+                # Left to error where it's used
+                cls.log.warning(f"Unable to find {data} to preload")
+
+    @classmethod
+    def load(cls, path: str) -> pygame.Surface | bytes:
+        """ Loads an asset from the disk. Runs on a pool thread.
+            Sounds are only read, and made into sounds on the main thread """
+        if path.endswith(cls.SOUND_TYPES):
+            with open(path, "rb") as file:
+                return file.read()
+
+        return pygame.image.load(path)
+
+    @classmethod
+    def update(cls) -> None:
+        """ Adds the assets that have finished loading to the caches """
+        for path in [path for path, future in cls.pending.items()
+                     if future.done()]:
+            cls.add(path, cls.pending.pop(path))
+
+        if len(cls.pending) == 0 and cls.executor is not None:
+            cls.executor.shutdown(wait=False)
+            cls.executor = None
+            cls.log.info(f"Preloaded {cls.total} assets")
+
+    @classmethod
+    def add(cls, path: str, future: Future) -> None:
+        """ Adds a loaded asset to the image or sound cache,
+            unless it was loaded while it was being preloaded """
+        try:
+            asset = future.result()
+
+            if isinstance(asset, bytes):
+                Sound.addPreloaded(path, asset)
+                return
+        except (pygame.error, OSError) as e:
+            cls.log.warning(f"Unable to preload {path}: {e}")
+            return
+
+        if Image.isLoaded(path):
+            return
+
+        # Converted here as it needs the window
+        surf: pygame.Surface = asset.convert_alpha()
+
+        if Image.SCALE != 1:
+            size: Vect = Vect(surf.get_size()) * Image.SCALE
+            surf = pygame.transform.scale(surf, size.toTuple())
+
+        Image.addScaled(path, surf)
+
+    @classmethod
+    def finish(cls) -> None:
+        """ Waits for every asset to finish loading and adds them """
+        for future in cls.pending.values():
+            future.exception()  # Waits without raising
+
+        cls.update()
+
+    @classmethod
+    def stop(cls) -> None:
+        """ Cancels the assets that haven't started loading """
+        if cls.executor is not None:
+            cls.executor.shutdown(wait=False, cancel_futures=True)
+            cls.executor = None
+
+        cls.pending.clear()
+
+    @classmethod
+    def isLoaded(cls, path: str) -> bool:
+        """ Returns True if the asset is already in its cache """
+        if path.endswith(cls.SOUND_TYPES):
+            return Sound.isLoaded(path)
+
+        return Image.isLoaded(path)
+
+    # Getters
+    @classmethod
+    def isFinished(cls) -> bool:
+        return len(cls.pending) == 0
+
+    @classmethod
+    def getLoadedCount(cls) -> int:
+        """ Returns the number of assets that have been added """
+        return cls.total - len(cls.pending)
+
+    @classmethod
+    def getProgress(cls) -> float:
+        """ Returns the fraction of the assets that have been added """
+        if cls.total == 0:
+            return 1
+
+        return cls.getLoadedCount() / cls.total
@@ -0,0 +1,108 @@
+from __future__ import annotations
+import pygame
+import logging
+import io
+
+
+class Sound:
+    """ Plays a sound file that is shared between every Sound with the
+        same path, so it is only loaded once no matter how many use it.
+        Each Sound only controls the channel it played on, so volumes
+        are still separate """
+    log = logging.getLogger(__name__)
+
+    # Static variables for all sounds to avoid duplicates
+    # Key: path, value: pygame.mixer.Sound (the loaded sound)
+    sounds: dict[str, pygame.mixer.Sound] = {}
+    # Key: path, value: number of Sounds using it
+    refCounts: dict[str, int] = {}
+    # Paths of sounds loaded by the preloader, which are kept
+    # loaded once nothing is using them so they're never loaded again
+    preloaded: set[str] = set()
+    # Key: channel id, value: Sound that last played on the channel.
+    # Sounds sharing a loaded sound can be given a channel another one
+    # used, so this tells which of them the channel belongs to
+    channelOwners: dict[int, Sound] = {}
+
+    def __init__(self, path: str) -> None:
+        """ Loads the sound if it hasn't been loaded before """
+        if path not in self.sounds:
+            self.sounds[path] = pygame.mixer.Sound(path)
+            self.refCounts[path] = 0
+            self.log.info(f"Loaded sound {path}")
+
+        self.refCounts[path] += 1
+
+        self.path: str = path
+        self.sound: pygame.mixer.Sound = self.sounds[path]
+        self.released: bool = False
+
+        # Channel the sound was last played on, if any
+        self.channel: pygame.mixer.Channel = None
+        self.volume: float = 1
+
+    @classmethod
+    def addPreloaded(cls, path: str, data: bytes) -> None:
+        """ Adds a sound from the file contents read by the preloader to
+            the cache, keeping the cached sound if it was loaded since.
+            The mixer isn't thread safe, so this must be on the main thread """
+        if path not in cls.sounds:
+            cls.sounds[path] = pygame.mixer.Sound(file=io.BytesIO(data))
+            cls.refCounts[path] = 0
+
+        cls.preloaded.add(path)
+
+    @classmethod
+    def isLoaded(cls, path: str) -> bool:
+        """ Returns True if the sound at the path is already cached """
+        return path in cls.sounds
+
+    def release(self) -> None:
+        """ Stops the sound and removes it from the cache
+            once nothing else is using it """
+        if self.released:
+            return
+
+        self.stop()
+        self.released = True
+
+        self.refCounts[self.path] -= 1
+        if self.refCounts[self.path] <= 0 and self.path not in self.preloaded:
+            del self.sounds[self.path]
+            del self.refCounts[self.path]
+            self.log.info(f"Unloaded sound {self.path}")
+
+    def play(self, loops: int = 0) -> None:
+        """ Plays the sound at its volume, looping forever if loops is -1 """
+        # None if there are no free channels
+        self.channel = self.sound.play(loops)
+
+        if self.channel is not None:
+            self.channelOwners[self.channel.id] = self
+            self.channel.set_volume(self.volume)
+
+    def setVolume(self, volume: float) -> None:
+        """ Sets the volume, including for the sound if it's playing """
+        self.volume = volume
+
+        if self.isPlaying():
+            self.channel.set_volume(volume)
+
+    def stop(self) -> None:
+        """ Stops the sound if it's playing """
+        if self.isPlaying():
+            self.channel.stop()
+            del self.channelOwners[self.channel.id]
+
+        self.channel = None
+
+    def isPlaying(self) -> bool:
+        """ Returns True if the sound is still playing on its channel.
+            The channel may have been given to another sound since,
+            including another Sound with the same loaded sound """
+        return (self.channel is not None and self.channel.get_busy()
+                and self.channelOwners.get(self.channel.id) is self)
+
+    # Getters
+    def getPath(self) -> str: return self.path
+    def getVolume(self) -> float: return self.volume
@@ -0,0 +1,225 @@
+from __future__ import annotations
+import pygame
+import logging
+from math import floor, inf
+from typing import Callable
+
+from src.utility.vector import Vect
+
+
+class SpatialHash:
+    """ Uniform grid that buckets entities by their center position,
+        so that nearby entities can be found without checking every one.
+        Entities must have getCenterPos and getSize functions """
+    log = logging.getLogger(__name__)
+
+    def __init__(self, cellSize: float) -> None:
+        """ Creates an empty grid with square cells of the given size """
+        self.cellSize: float = cellSize
+
+        # Key: (x, y) cell coordinates, value: list of entities in the cell
+        self.cells: dict[tuple[int, int], list] = {}
+        self.count: int = 0
+
+        # Bounds of the occupied cells, used to stop searches early
+        self.minX: int = 0
+        self.minY: int = 0
+        self.maxX: int = 0
+        self.maxY: int = 0
+
+        # Largest half width and half height of any entity in the grid.
+        # An entity can stick out of its cell by up to this much
+        self.maxHalfSize: Vect = Vect()
+
+    def clear(self) -> None:
+        """ Removes all entities from the grid """
+        self.cells.clear()
+        self.count = 0
+        self.maxHalfSize = Vect()
+
+    def rebuild(self, entities: list) -> None:
+        """ Clears the grid and inserts all the given entities """
+        self.clear()
+
+        for entity in entities:
+            self.insert(entity)
+
+    def rebuildFromCenters(self, entities: list,
+                           centers: list[tuple[float, float]],
+                           maxHalfSize: Vect) -> None:
+        """ Clears the grid and inserts all the given entities using
+            already known center positions and largest half size,
+            which avoids calling functions on every entity """
+        self.clear()
+
+        for entity, (x, y) in zip(entities, centers):
+            cell = (floor(x / self.cellSize), floor(y / self.cellSize))
+
+            if cell in self.cells:
+                self.cells[cell].append(entity)
+            else:
+                self.cells[cell] = [entity]
+
+        self.count = len(entities)
+        self.maxHalfSize = maxHalfSize
+
+        if self.count > 0:
+            # Bounds found from the occupied cells
+            self.minX = min(cell[0] for cell in self.cells)
+            self.minY = min(cell[1] for cell in self.cells)
+            self.maxX = max(cell[0] for cell in self.cells)
+            self.maxY = max(cell[1] for cell in self.cells)
+
+    def insert(self, entity) -> None:
+        """ Adds an entity to the cell containing its center """
+        cell: tuple[int, int] = self.getCell(entity.getCenterPos())
+
+        if cell in self.cells:
+            self.cells[cell].append(entity)
+        else:
+            self.cells[cell] = [entity]
+
+        # Expand the occupied bounds to include the new cell
+        if self.count == 0:
+            self.minX, self.minY = cell
+            self.maxX, self.maxY = cell
+        else:
+            self.minX = min(self.minX, cell[0])
+            self.minY = min(self.minY, cell[1])
+            self.maxX = max(self.maxX, cell[0])
+            self.maxY = max(self.maxY, cell[1])
+
+        halfSize: Vect = entity.getSize() / 2
+        self.maxHalfSize.x = max(self.maxHalfSize.x, halfSize.x)
+        self.maxHalfSize.y = max(self.maxHalfSize.y, halfSize.y)
+
+        self.count += 1
+
+    def nearest(self, pos: Vect,
+                condition: Callable[[any], bool] = None) -> any:
+        """ Returns the entity closest to pos, or None if there are none.
+            If given, only entities where condition(entity) is True count.
+            Searches rings of cells outwards from pos, stopping once
+            no unsearched cell could contain anything closer """
+        if self.count == 0:
+            return None
+
+        cellX, cellY = self.getCell(pos)
+        maxRing: int = self.getMaxRing(cellX, cellY)
+
+        closest = None
+        lowestDist: float = inf
+
+        for ring in range(maxRing + 1):
+            # Everything in this ring is at least (ring - 1) cells away
+            if (ring - 1) * self.cellSize >= lowestDist:
+                break
+
+            for entity in self.queryRing(cellX, cellY, ring):
+                if condition is not None and not condition(entity):
+                    continue
+
+                dist: float = pos.dist(entity.getCenterPos())
+                if dist < lowestDist:
+                    closest = entity
+                    lowestDist = dist
+
+        return closest
+
+    def queryRect(self, rect: pygame.Rect) -> list:
+        """ Returns the entities in every cell that could contain an entity
+            overlapping the rect. This is only a broad phase, so the
+            entities returned still need an exact collision test """
+        if self.count == 0:
+            return []
+
+        # Expand the rect by the largest entity half size, since entities
+        # are stored by their center and can stick out of their cell
+        startX, startY = self.getCell(
+            Vect(rect.left, rect.top) - self.maxHalfSize
+        )
+        endX, endY = self.getCell(
+            Vect(rect.right, rect.bottom) + self.maxHalfSize
+        )
+
+        candidates: list = []
+        for cell in self.getCellsBetween(startX, startY, endX, endY):
+            candidates.extend(cell)
+
+        return candidates
+
+    def queryCircle(self, center: Vect, radius: float) -> list:
+        """ Returns the entities whose center is within
+            the radius of the given center position """
+        if self.count == 0:
+            return []
+
+        startX, startY = self.getCell(center - radius)
+        endX, endY = self.getCell(center + radius)
+
+        inRange: list = []
+        for cell in self.getCellsBetween(startX, startY, endX, endY):
+            for entity in cell:
+                if center.dist(entity.getCenterPos()) <= radius:
+                    inRange.append(entity)
+
+        return inRange
+
+    def getCellsBetween(self, startX: int, startY: int,
+                        endX: int, endY: int) -> list[list]:
+        """ Returns the lists of entities in the occupied cells
+            between the start and end cells (inclusive) """
+        cells: list[list] = []
+
+        # Limit the search to the bounds of the occupied cells
+        for y in range(max(startY, self.minY), min(endY, self.maxY) + 1):
+            for x in range(max(startX, self.minX), min(endX, self.maxX) + 1):
+                if (x, y) in self.cells:
+                    cells.append(self.cells[(x, y)])
+
+        return cells
+
+    def queryRing(self, cellX: int, cellY: int, ring: int) -> list:
+        """ Returns the entities in the cells on the square ring that is
+            the given number of cells away from the center cell """
+        entities: list = []
+        for cell in self.getRing(cellX, cellY, ring):
+            entities.extend(self.cells.get(cell, ()))
+
+        return entities
+
+    def getRing(self, cellX: int, cellY: int,
+                ring: int) -> list[tuple[int, int]]:
+        """ Returns the cells on the square ring that is
+            the given number of cells away from the center cell """
+        if ring == 0:
+            return [(cellX, cellY)]
+
+        cells: list[tuple[int, int]] = []
+
+        # Top and bottom rows
+        for x in range(cellX - ring, cellX + ring + 1):
+            cells.append((x, cellY - ring))
+            cells.append((x, cellY + ring))
+
+        # Left and right columns, without the corners
+        for y in range(cellY - ring + 1, cellY + ring):
+            cells.append((cellX - ring, y))
+            cells.append((cellX + ring, y))
+
+        return cells
+
+    # Getters
+    def getCell(self, pos: Vect) -> tuple[int, int]:
+        """ Returns the coordinates of the cell containing pos """
+        return (floor(pos.x / self.cellSize), floor(pos.y / self.cellSize))
+
+    def getMaxRing(self, cellX: int, cellY: int) -> int:
+        """ Returns the furthest ring around the cell
+            that still contains occupied cells """
+        return max(cellX - self.minX, self.maxX - cellX,
+                   cellY - self.minY, self.maxY - cellY)
+
+    def getCellSize(self) -> float: return self.cellSize
+    def getCount(self) -> int: return self.count
+    def isEmpty(self) -> bool: return self.count == 0
@@ -29,6 +29,16 @@ class Waves:
                            "in constants", cls.log, recoverable=True)
             cls.WAVES_DELAY: float = 5
 
+        try:
+            # Most enemies that can be alive at once. Any more that spawn
+            # are kept as counts until there is room for them
+            cls.MAX_ACTIVE: int = constants["waves"]["maxActiveEnemies"]
+        except KeyError:
+            ErrorUI.create("Unable to find waves -> maxActiveEnemies "
+                           "in constants. Defaulting to 300", cls.log,
+                           recoverable=True)
+            cls.MAX_ACTIVE: int = 300
+
     def __init__(self, database: Database) -> None:
         """ Sets up wave timers and data """
         self.db = database
@@ -41,6 +51,11 @@ class Waves:
         self.spawnData: list[dict] = []  # Spawning data for each enemy type
         self.spawnQueue: list[Warrior] = []  # Enemies that have been spawned
 
+        # Enemies that have spawned while over the max active enemies,
+        # waiting to be created. Key: (type, level), value: amount
+        self.reserves: dict[tuple[str, int], int] = {}
+        self.enemiesLeft: int = 0  # Enemies left to kill in the wave
+
         self.loadWave(0)  # Load the first wave
 
         self.lost: bool = False
@@ -97,7 +112,7 @@ class Waves:
         if self.betweenWaves:  # Delay timer between waves
             # During the period between waves allies cannot spawn
             for warrior in allies:
-                warrior.stopSounds()
+                warrior.releaseSounds()
             allies.clear()
 
             self.waveTimer.update(window)
@@ -110,8 +125,11 @@ class Waves:
 
         else:
             self.updateDelays(window)
+            self.spawnReserves(len(enemies))
             self.testEndPeriod(allies, enemies)
 
+        self.updateEnemiesLeft(len(enemies))
+
     def updateDelays(self, window: Window) -> None:
         """ Updates the delays for the warriors in the wave,
             spawning any if they are ready """
@@ -128,14 +146,42 @@ class Waves:
             # Start timer is False, so spawn warriors
             data["spawnTimer"].update(window)
             while data["spawnTimer"].completed():
-                for _ in range(data["spawnAmount"]):
-                    # Amount left to spawn of the warrior type is zero.
-                    if data["amount"] <= 0:
-                        break
-
-                    # Spawn enemy
-                    self.spawnWarrior(data["type"], data["level"])
-                    data["amount"] -= 1
+                # Add enemies to the reserves, without going over
+                # the amount left to spawn of the warrior type
+                amount: int = min(data["spawnAmount"], data["amount"])
+                if amount > 0:
+                    key = (data["type"], data["level"])
+                    self.reserves[key] = self.reserves.get(key, 0) + amount
+                    data["amount"] -= amount
+
+    def spawnReserves(self, activeCount: int) -> None:
+        """ Spawns reserved enemies until the max active enemies is
+            reached, taking turns between warrior types """
+        free: int = self.MAX_ACTIVE - activeCount - len(self.spawnQueue)
+
+        while free > 0 and len(self.reserves) > 0:
+            share: int = max(1, free // len(self.reserves))
+
+            for key in list(self.reserves.keys()):
+                amount: int = min(share, self.reserves[key], free)
+                if amount <= 0:
+                    break
+
+                self.spawnWarriors(key[0], key[1], amount)
+                free -= amount
+
+                # Move the type to the end so others are spawned first
+                # next time, or remove it if there are none left
+                remaining: int = self.reserves.pop(key) - amount
+                if remaining > 0:
+                    self.reserves[key] = remaining
+
+    def updateEnemiesLeft(self, activeCount: int) -> None:
+        """ Counts the enemies that are alive, waiting to spawn,
+            or have not spawned yet in the wave """
+        self.enemiesLeft = (activeCount + len(self.spawnQueue)
+                            + sum(self.reserves.values())
+                            + sum(data["amount"] for data in self.spawnData))
 
     def testEndPeriod(self, allies: list[Warrior],
                       enemies: list[Warrior]) -> None:
@@ -145,6 +191,10 @@ class Waves:
             if data["amount"] > 0:
                 return
 
+        # Test if all reserved enemies have been spawned
+        if len(self.reserves) > 0:
+            return
+
         # During the period between the last enemy being spawned
         # and the last enemy dying, test the following conditions:
 
@@ -162,9 +212,12 @@ class Waves:
             self.lost = True
             self.saveHighscore(self.waveNum + 1)
 
-    def spawnWarrior(self, warriorType: str, level: int) -> None:
-        """ Spawns a warrior by adding it to the queue """
-        self.spawnQueue.append(Warrior(warriorType, level, False))
+    def spawnWarriors(self, warriorType: str, level: int,
+                      amount: int) -> None:
+        """ Spawns warriors by adding them to the queue """
+        self.spawnQueue.extend(
+            Warrior.spawnMany(warriorType, level, False, amount)
+        )
 
     def clearSpawnQueue(self) -> None:
         """ Clears the spawn queue """
@@ -173,5 +226,6 @@ class Waves:
     # Geters
     def getWaveNum(self) -> int: return self.waveNum
     def getSpawnQueue(self) -> list[Warrior]: return self.spawnQueue
+    def getEnemiesLeft(self) -> int: return self.enemiesLeft
     def hasLost(self) -> bool: return self.lost
     def getHighscore(self) -> int: return self.highscore
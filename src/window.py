@@ -1,6 +1,7 @@
 import pygame
 import logging
-import time
+from math import ceil
+from time import perf_counter
 import enum
 
 from src.utility.vector import Vect
@@ -71,6 +72,32 @@ class Window:
             cls.FPS: int = 60
             cls.LOG_FPS: bool = False
 
+        try:
+            # Simulation ticks per second, or -1 to update once per frame
+            # with a variable deltatime
+            cls.TICK_RATE: int = constants["window"]["tickRate"]
+            # Most ticks run in one frame, so the game slows down
+            # instead of freezing if updates fall behind
+            cls.MAX_TICKS: int = constants["window"]["maxTicksPerFrame"]
+        except KeyError:
+            from src.ui.interfaces.errorUI import ErrorUI
+            ErrorUI.create("Unable to find window -> [tickRate or "
+                           "maxTicksPerFrame] in constants. "
+                           "Defaulting to -1 and 5",
+                           cls.log, recoverable=True)
+            cls.TICK_RATE: int = -1
+            cls.MAX_TICKS: int = 5
+
+        try:
+            # Whether to only update the areas of the display
+            # that were drawn to, instead of the whole window
+            cls.DIRTY_RECTS: bool = constants["window"]["dirtyRects"]
+        except KeyError:
+            from src.ui.interfaces.errorUI import ErrorUI
+            ErrorUI.create("Unable to find window -> dirtyRects in constants. "
+                           "Defaulting to False", cls.log, recoverable=True)
+            cls.DIRTY_RECTS: bool = False
+
         try:
             # Whether or not the window should be resizable
             cls.RESIZABLE: bool = constants["window"]["resizable"]
@@ -99,6 +126,28 @@ class Window:
         self.windowSize: Vect = self.MIN_SIZE  # Gets updated when resized
         self.windowFlags: int = 0
 
+        # Everything is rendered to the canvas. It's the window itself,
+        # unless rendering at the images' native resolution, where it's
+        # a smaller surface scaled up to the window once per frame
+        self.renderScale: int = Image.RENDER_SCALE
+        self.canvas: pygame.Surface = None
+        self.canvasSize: Vect = None
+        # Area of the window that the canvas is scaled up onto
+        self.scaledArea: pygame.Surface = None
+
+        # Text is drawn onto the window at its resolution after the canvas
+        # is scaled up, since the font is unreadable at the canvas's size.
+        # Each is (text surface, window position, window area it's clipped
+        # to), along with the area of the canvas it covers
+        self.textQueue: list[tuple] = []
+        self.textRects: list[pygame.Rect] = []
+
+        # Anything rendered over queued text is rendered to a transparent
+        # layer, which is blended over the window once it's scaled up
+        self.baseCanvas: pygame.Surface = None
+        self.layerCanvas: pygame.Surface = None
+        self.scaledLayer: pygame.Surface = None
+
         if self.RESIZABLE:
             self.windowFlags |= pygame.RESIZABLE  # make window resizable
 
@@ -115,9 +164,18 @@ class Window:
         # Clock for fixed framerate (if enabled)
         self.clock: pygame.Clock = pygame.time.Clock()
 
-        # Deltatime
+        # Deltatime, which is the fixed tick length if there is a tick rate
         self.deltaTime: float = 0
-        self.previousTime: float = time.time()
+        self.frameTime: float = 0  # Real time taken by the previous frame
+        self.previousTime: float = perf_counter()
+
+        # Fixed tick time that has passed but hasn't been simulated yet
+        self.accumulator: float = 0
+        if self.isFixedTimestep():
+            self.deltaTime = 1 / self.TICK_RATE
+            # The first frame runs one tick, so everything
+            # is updated before it's first rendered
+            self.accumulator = self.deltaTime
 
         # For finding the average FPS over each second to output to the console
         self.lastSecondFPS: list[int] = []
@@ -142,36 +200,91 @@ class Window:
         # Hide inputs
         self.hideInputs: bool = False
 
+        # Blits waiting to be drawn together while batching.
+        # Each is (surface, position, area)
+        self.batching: bool = False
+        self.blitQueue: list[tuple] = []
+
+        # Areas drawn to this frame and the previous frame, which are the
+        # only areas of the display updated when using dirty rects
+        self.dirtyRects: list[pygame.Rect] = []
+        self.prevDirtyRects: list[pygame.Rect] = []
+
+        # Keys of the static layers drawn this frame and the previous
+        # frame. Static layers aren't recorded as dirty, so the whole
+        # display is updated whenever one changes (e.g. the camera moves)
+        self.staticKeys: list[tuple] = []
+        self.prevStaticKeys: list[tuple] = []
+        self.drawingStatic: bool = False
+
+        # Update the whole display on the next frame
+        self.fullRepaint: bool = True
+
     def setWindow(self, size: Vect) -> None:
         """ Sets up the Pygame window with the given size
             and various settings """
         self.window = pygame.display.set_mode(size.toTuple(),
                                               self.windowFlags,
                                               vsync=self.VSYNC)
+        self.createCanvas()
+        self.fullRepaint = True
+
+    def createCanvas(self) -> None:
+        """ Creates the surface everything is rendered to,
+            based on the window size and render scale """
+        if self.renderScale == 1:
+            self.canvas = self.window
+            self.canvasSize = Vect(self.window.get_size())
+            return
+
+        self.canvasSize = Vect(self.window.get_size()) // self.renderScale
+        self.canvas = pygame.Surface(self.canvasSize.toTuple())
+        self.baseCanvas = self.canvas
+
+        # Any pixels left over from rounding down the size stay black
+        self.window.fill((0, 0, 0))
+        self.scaledArea = self.window.subsurface(
+            Vect.toRect(Vect(0, 0), self.canvasSize * self.renderScale)
+        )
+
+        self.layerCanvas = pygame.Surface(self.canvasSize.toTuple(),
+                                          pygame.SRCALPHA)
+        self.scaledLayer = pygame.Surface(self.scaledArea.get_size(),
+                                          pygame.SRCALPHA)
 
     def update(self) -> None:
         """ Updates the window with what was
             rendered over the previous frame """
 
-        pygame.display.flip()  # Update the window
-        self.window.fill((0, 0, 0))  # Clear the window
+        if self.renderScale != 1:
+            self.drawCanvas()
+            self.canvas = self.baseCanvas
+
+        self.updateDisplay()
+        self.canvas.fill((0, 0, 0))  # Clear the window
 
         # Cap FPS
         if self.FPS > 0 and not self.VSYNC:
             self.clock.tick(self.FPS)
 
-        # Deltatime is the time that has elapsed since the previous function
-        # Any movement is multiplied by it to make it framerate independent
-        currentTime: float = time.time()
-        self.deltaTime = currentTime - self.previousTime
+        # Frame time is the time that has elapsed since the previous function
+        currentTime: float = perf_counter()
+        self.frameTime = currentTime - self.previousTime
         self.previousTime = currentTime
 
-        self.frameTimer += self.deltaTime
+        # Deltatime is the time each update simulates. Any movement
+        # is multiplied by it to make it framerate independent
+        if self.isFixedTimestep():
+            self.accumulator += self.frameTime
+        else:
+            self.deltaTime = self.frameTime
+
+        self.frameTimer += self.frameTime
 
         if self.LOG_FPS:
-            if self.deltaTime != 0:
-                # Changes deltatime into FPS
-                self.lastSecondFPS.append(1 / self.deltaTime)
+            if self.frameTime != 0:
+                # Changes frame time into FPS
+                self.lastSecondFPS.append(1 / self.frameTime)
 
             if self.frameTimer >= 1:
                 self.frameTimer -= 1
@@ -183,15 +296,80 @@ class Window:
                 self.log.info(f"{round(average, 2)} FPS")
                 self.lastSecondFPS.clear()
 
+    def drawCanvas(self) -> None:
+        """ Scales the canvas up to the window, blending it over what's
+            already there if it's a layer, then draws the queued text """
+        self.flush()
+
+        if self.canvas is self.baseCanvas:
+            pygame.transform.scale(self.canvas, self.scaledArea.get_size(),
+                                   self.scaledArea)
+        else:
+            pygame.transform.scale(self.canvas, self.scaledArea.get_size(),
+                                   self.scaledLayer)
+            self.scaledArea.blit(self.scaledLayer, (0, 0))
+
+        for surf, pos, clip in self.textQueue:
+            self.window.set_clip(clip)
+            self.window.blit(surf, pos)
+        self.window.set_clip(None)
+
+        self.textQueue.clear()
+        self.textRects.clear()
+
+    def startLayer(self) -> None:
+        """ Draws everything rendered so far to the window, and continues
+            rendering on a transparent layer that's blended over it """
+        self.drawCanvas()
+
+        self.canvas = self.layerCanvas
+        self.canvas.fill((0, 0, 0, 0))
+
+    def coversText(self, rect: pygame.Rect) -> bool:
+        """ Returns whether the canvas area covers any queued text """
+        return rect.collidelist(self.textRects) != -1
+
+    def updateDisplay(self) -> None:
+        """ Shows what was rendered this frame. With dirty rects,
+            only the areas drawn to this frame or the previous one are
+            updated, since nothing else can have changed """
+        if not self.DIRTY_RECTS:
+            pygame.display.flip()
+            return
+
+        if self.fullRepaint or self.staticKeys != self.prevStaticKeys:
+            pygame.display.flip()
+        else:
+            pygame.display.update([
+                self.toWindowRect(rect)
+                for rect in self.prevDirtyRects + self.dirtyRects
+            ])
+
+        self.fullRepaint = False
+        self.prevDirtyRects, self.dirtyRects = self.dirtyRects, []
+        self.prevStaticKeys, self.staticKeys = self.staticKeys, []
+
+    def toWindowRect(self, rect: pygame.Rect) -> pygame.Rect:
+        """ Returns the area of the window that an area of the canvas
+            is shown on """
+        if self.renderScale == 1:
+            return rect
+
+        return pygame.Rect(rect.x * self.renderScale,
+                           rect.y * self.renderScale,
+                           rect.w * self.renderScale,
+                           rect.h * self.renderScale)
+
     def handleInputs(self) -> None:
         """ Handle any window inputs """
 
-        # Mouse input
-        self.mousePos = Vect(pygame.mouse.get_pos())
+        # Mouse input, as a position on the canvas
+        self.mousePos = Vect(pygame.mouse.get_pos()) // self.renderScale
 
-        # Update inputs
-        self.updateInputs(self.inputs)
-        self.updateInputs(self.mouseButtons)
+        # Update inputs. With a fixed timestep this is done after each
+        # tick instead, so inputs aren't missed by frames without a tick
+        if not self.isFixedTimestep():
+            self.useInputs()
 
         # Iterate through all pygame-given events
         for event in pygame.event.get():
@@ -225,6 +403,7 @@ class Window:
             # Window resize
             elif event.type == pygame.VIDEORESIZE:
                 self.windowSize = Vect(self.window.get_size())
+                self.fullRepaint = True
 
                 # Set minimum window size
                 if self.windowSize.x < self.MIN_SIZE.x:
@@ -233,6 +412,28 @@ class Window:
                 elif self.windowSize.y < self.MIN_SIZE.y:
                     self.setWindow(Vect(self.windowSize.x, self.MIN_SIZE.y))
 
+                else:
+                    self.createCanvas()
+
+    def useInputs(self) -> None:
+        """ Moves just pressed and released inputs to their next state
+            once they have been seen by an update """
+        self.updateInputs(self.inputs)
+        self.updateInputs(self.mouseButtons)
+
+    def takeTicks(self) -> int:
+        """ Returns the number of fixed ticks to simulate this frame,
+            removing their time from the accumulator """
+        ticks: int = int(self.accumulator // self.deltaTime)
+        self.accumulator -= ticks * self.deltaTime
+
+        if ticks > self.MAX_TICKS:
+            # Drop the time that can't be caught up on
+            ticks = self.MAX_TICKS
+            self.accumulator = 0
+
+        return ticks
+
     def updateInputs(self, buttons: dict[str, InputState]) -> None:
         """ Updates the values of a dict
             to cycle between input states """
@@ -245,24 +446,157 @@ class Window:
             elif buttons[key] == InputState.RELEASED:
                 buttons[key] = InputState.INACTIVE
 
+    def startBatch(self) -> None:
+        """ Queues renders until the batch ends, so they are
+            all drawn with a single call """
+        self.batching = True
+
+    def endBatch(self) -> None:
+        """ Draws the queued renders and stops batching """
+        self.flush()
+        self.batching = False
+
+    def flush(self) -> None:
+        """ Draws all queued renders in the order they were queued """
+        if len(self.blitQueue) > 0:
+            if self.isRecording():
+                self.dirtyRects.extend(self.canvas.blits(self.blitQueue))
+            else:
+                self.canvas.blits(self.blitQueue, doreturn=False)
+
+            self.blitQueue.clear()
+
+    def startStatic(self, key: tuple) -> None:
+        """ Starts rendering a static layer, which draws the same thing
+            every frame that it has the same key, so its renders don't
+            need to be recorded as dirty """
+        if not self.DIRTY_RECTS:
+            return
+
+        self.flush()
+        self.drawingStatic = True
+        self.staticKeys.append(key)
+
+    def endStatic(self) -> None:
+        """ Stops rendering a static layer """
+        if not self.DIRTY_RECTS:
+            return
+
+        self.flush()
+        self.drawingStatic = False
+
     def render(self, img: Image, pos: Vect,
                area: pygame.Rect = None) -> None:
         """ Renders an image on a window at a given position,
             with a given portion (area) of the image to render if specified.
             Renders the image with the image scale specified in constants """
-        self.window.blit(img.getSurf(), pos.toTuple(), area=area)
+        if self.textRects or img.texts:
+            self.renderOverText(img, pos, area)
+            return
+
+        if self.batching:
+            self.blitQueue.append((img.getSurf(), pos.toTuple(), area))
+        else:
+            rect = self.canvas.blit(img.getSurf(), pos.toTuple(), area=area)
+            self.recordDirty(rect)
+
+    def renderOverText(self, img: Image, pos: Vect,
+                       area: pygame.Rect = None) -> None:
+        """ Renders an image that might cover queued text, starting a new
+            layer over the text if it does, and then queues its own text """
+        size: Vect = img.getSize() if area is None else Vect(area.size)
+        rect: pygame.Rect = Vect.toRect(pos.floor(), size)
+
+        if self.coversText(rect):
+            self.startLayer()
+
+        self.flush()  # Drawn now to find the area it covers
+        rect = self.canvas.blit(img.getSurf(), pos.toTuple(), area=area)
+        self.recordDirty(rect)
+
+        for text, textPos, clip in img.texts:
+            self.renderText(text, *Image.moveText(textPos, clip, pos,
+                                                  area, rect))
+
+    def renderText(self, text: Image, pos: Vect,
+                   clip: pygame.Rect = None) -> None:
+        """ Renders text at a given position. At native resolution, it's
+            queued to be drawn over the canvas once it's scaled up to the
+            window, only showing the area of it that's in the clip rect """
+        if self.renderScale == 1:
+            self.render(text, pos)
+            return
+
+        self.flush()  # Everything rendered before is under the text
+
+        # Text is at the window's size, so it covers less of the canvas
+        pos = pos.floor()
+        size: Vect = text.getSize()
+        rect = pygame.Rect(pos.x, pos.y, ceil(size.x / self.renderScale),
+                           ceil(size.y / self.renderScale))
+        if clip is not None:
+            rect = rect.clip(clip)
+
+        if rect.width == 0 or rect.height == 0:
+            return
+
+        self.textQueue.append((text.getSurf(),
+                               (pos * self.renderScale).toTuple(),
+                               self.toWindowRect(rect)))
+        self.textRects.append(rect)
+        self.recordDirty(rect)
+
+    def renderMany(self, blits: list[tuple]) -> None:
+        """ Renders a list of (pygame.Surface, position tuple, area) """
+        if self.textRects:
+            # Not worth finding whether any of them cover the text
+            self.startLayer()
+
+        if self.batching:
+            self.blitQueue.extend(blits)
+        elif self.isRecording():
+            self.dirtyRects.extend(self.canvas.blits(blits))
+        else:
+            self.canvas.blits(blits, doreturn=False)
 
     def drawRect(self, pos: Vect, size: Vect,
                  color: tuple[int, int, int]) -> None:
         """ Draws a rectangle on the window """
+        self.flush()  # Draw over anything queued before
+
         rect = pygame.Rect(pos.toTuple(), size.toTuple())
-        pygame.draw.rect(self.window, color, rect)
+        if self.coversText(rect):
+            self.startLayer()
+
+        self.recordDirty(pygame.draw.rect(self.canvas, color, rect))
+
+    def recordDirty(self, rect: pygame.Rect) -> None:
+        """ Records an area that was drawn to, if using dirty rects """
+        if self.isRecording():
+            self.dirtyRects.append(rect)
+
+    def isRecording(self) -> bool:
+        """ Returns whether renders are being recorded as dirty """
+        return self.DIRTY_RECTS and not self.drawingStatic
 
     # Getters
     def getDeltaTime(self) -> float:
         """ Returns the time that has elapsed since the previous function """
         return self.deltaTime
 
+    def getFrameTime(self) -> float:
+        """ Returns the real time the previous frame took """
+        return self.frameTime
+
+    def getInterpolation(self) -> float:
+        """ Returns how far between the last tick and the next one
+            the current frame is, from 0 to 1 """
+        if not self.isFixedTimestep():
+            return 1
+        return min(self.accumulator / self.deltaTime, 1)
+
+    def isFixedTimestep(self) -> bool: return self.TICK_RATE > 0
+
     def getMousePos(self) -> Vect:
         """ Returns the mouse position """
         if self.hideInputs:
@@ -270,7 +604,9 @@ class Window:
         return self.mousePos
 
     def isClosed(self) -> bool: return self.quit
-    def getSize(self) -> Vect: return self.windowSize
+    def getSize(self) -> Vect:
+        """ Returns the size of the canvas that everything is rendered to """
+        return self.canvasSize
 
     # Keyboard inputs
     def getKey(self, key: str) -> bool:
@@ -308,6 +644,10 @@ class Window:
             and not self.hideInputs
 
     # Setters
+    def setDeltaTime(self, deltaTime: float) -> None:
+        """ Sets the deltatime, used to run updates on a synthetic clock """
+        self.deltaTime = deltaTime
+
     def setHideInputs(self, hide: bool) -> None:
         """ Sets whether or not to hide inputs """
         self.hideInputs = hide